@@ -7,6 +7,7 @@ from pathlib import Path
 import pytest
 
 from flask import current_app
+from sqlalchemy.exc import IntegrityError
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
@@ -14,9 +15,9 @@ if str(ROOT) not in sys.path:
 
 from tickettracker.app import create_app
 from tickettracker.config import DEFAULT_CONFIG
-from tickettracker.demo import DemoModeError, get_demo_manager
+from tickettracker.demo import DemoModeError, get_demo_manager, load_demo_dataset
 from tickettracker.extensions import db
-from tickettracker.models import Ticket
+from tickettracker.models import Attachment, Tag, Ticket, TicketTag, TicketUpdate
 
 
 def _write_config(target: Path, data: dict) -> Path:
@@ -40,6 +41,178 @@ def app_with_storage(tmp_path):
     return app, config_path, uploads_path
 
 
+def _write_dataset(target: Path, tickets: list, tags: list | None = None) -> Path:
+    target.write_text(json.dumps({"tags": tags or [], "tickets": tickets}), encoding="utf-8")
+    return target
+
+
+@pytest.mark.parametrize("insert_returning", [True, False])
+def test_load_demo_dataset_links_rows_and_replaces_previous_load(
+    app_with_storage, tmp_path, monkeypatch, insert_returning
+):
+    app, _, uploads_path = app_with_storage
+    with app.app_context():
+        dialect = db.engine.dialect
+        monkeypatch.setattr(dialect, "insert_returning", insert_returning)
+        monkeypatch.setattr(dialect, "insert_executemany_returning", insert_returning)
+
+    first = _write_dataset(
+        tmp_path / "first.json",
+        tags=[{"name": "network"}, {"name": "hardware"}],
+        tickets=[
+            {
+                "title": "Switch down",
+                "description": "Core switch offline.",
+                "tags": ["network", " network", "hardware"],
+                "updates": [
+                    {"body": "Investigating", "attachments": [{"stored_filename": "demo/a.txt"}]},
+                    {"body": "Replaced PSU", "attachments": [{"stored_filename": "demo/b.txt"}]},
+                ],
+                "attachments": [{"stored_filename": "demo/c.txt"}],
+            },
+            {
+                "title": "Printer jam",
+                "description": "Paper stuck in tray 2.",
+                "tags": ["hardware"],
+                "updates": [
+                    {"body": "Cleared jam", "attachments": [{"stored_filename": "demo/d.txt"}]},
+                ],
+            },
+        ],
+    )
+    second = _write_dataset(
+        tmp_path / "second.json",
+        tags=[{"name": "access"}],
+        tickets=[{"title": "Badge reset", "description": "Badge stopped working.", "tags": ["access"]}],
+    )
+
+    with app.app_context():
+        load_demo_dataset(first, uploads_directory=uploads_path)
+
+        switch = Ticket.query.filter_by(title="Switch down").one()
+        printer = Ticket.query.filter_by(title="Printer jam").one()
+        assert sorted(switch.tag_names) == ["hardware", "network"]
+        assert TicketTag.query.filter_by(ticket_id=switch.id).count() == 2
+        assert printer.tag_names == ["hardware"]
+
+        updates = {update.body: update for update in TicketUpdate.query.all()}
+        assert {body: update.ticket_id for body, update in updates.items()} == {
+            "Investigating": switch.id,
+            "Replaced PSU": switch.id,
+            "Cleared jam": printer.id,
+        }
+        owners = {
+            attachment.stored_filename: (attachment.ticket_id, attachment.update_id)
+            for attachment in Attachment.query.all()
+        }
+        assert owners == {
+            "demo/a.txt": (switch.id, updates["Investigating"].id),
+            "demo/b.txt": (switch.id, updates["Replaced PSU"].id),
+            "demo/c.txt": (switch.id, None),
+            "demo/d.txt": (printer.id, updates["Cleared jam"].id),
+        }
+        db.session.commit()
+
+        load_demo_dataset(second, uploads_directory=uploads_path)
+
+        assert [ticket.title for ticket in Ticket.query.all()] == ["Badge reset"]
+        assert [tag.name for tag in Tag.query.all()] == ["access"]
+        assert TicketTag.query.count() == 1
+        assert TicketUpdate.query.count() == 0
+        assert Attachment.query.count() == 0
+
+        # Rows from the first load are gone; drop them from the identity map.
+        db.session.expunge_all()
+        db.session.add(Ticket(title="After load", description="Takes the next id."))
+        db.session.commit()
+        assert Ticket.query.count() == 2
+
+
+def test_load_demo_dataset_writes_attachment_files(app_with_storage, tmp_path):
+    app, _, uploads_path = app_with_storage
+
+    existing = uploads_path / "demo" / "existing.txt"
+    existing.parent.mkdir(parents=True, exist_ok=True)
+    existing.write_text("already on disk", encoding="utf-8")
+
+    dataset = _write_dataset(
+        tmp_path / "attachments.json",
+        tickets=[
+            {
+                "title": "Switch down",
+                "description": "Core switch offline.",
+                "attachments": [
+                    {"stored_filename": "demo/content.txt", "content": "switch log"},
+                    {"stored_filename": "demo/placeholder.txt"},
+                    {"stored_filename": "demo/existing.txt"},
+                    {"stored_filename": "demo/shared.txt", "content": "first copy"},
+                    {"stored_filename": "demo/shared.txt"},
+                ],
+            }
+        ],
+    )
+
+    with app.app_context():
+        load_demo_dataset(dataset, uploads_directory=uploads_path)
+
+        contents = {
+            name: (uploads_path / "demo" / name).read_bytes()
+            for name in ("content.txt", "placeholder.txt", "existing.txt", "shared.txt")
+        }
+        assert contents == {
+            "content.txt": b"switch log",
+            "placeholder.txt": b"Demo attachment placeholder",
+            "existing.txt": b"already on disk",
+            "shared.txt": b"first copy",
+        }
+        sizes = [
+            (attachment.stored_filename, attachment.size)
+            for attachment in Attachment.query.order_by(Attachment.id)
+        ]
+        assert sizes == [
+            ("demo/content.txt", len(contents["content.txt"])),
+            ("demo/placeholder.txt", len(contents["placeholder.txt"])),
+            ("demo/existing.txt", len(contents["existing.txt"])),
+            ("demo/shared.txt", len(contents["shared.txt"])),
+            ("demo/shared.txt", len(contents["shared.txt"])),
+        ]
+
+
+def _sqlite_durability() -> tuple:
+    connection = db.session.connection()
+    return (
+        connection.exec_driver_sql("PRAGMA journal_mode").scalar(),
+        connection.exec_driver_sql("PRAGMA synchronous").scalar(),
+    )
+
+
+def test_demo_load_restores_sqlite_pragmas(app_with_storage, tmp_path):
+    app, _, uploads_path = app_with_storage
+
+    # Duplicate tag names fail on the unique constraint mid-load.
+    malformed = _write_dataset(
+        tmp_path / "malformed.json",
+        tags=[{"name": "network"}, {"name": "network"}],
+        tickets=[{"title": "Switch down", "description": "Core switch offline."}],
+    )
+
+    with app.app_context():
+        original = _sqlite_durability()
+        assert original[0] != "memory"
+        assert original[1] != 0
+        db.session.commit()
+
+        get_demo_manager(current_app).enable()
+        assert _sqlite_durability() == original
+        db.session.commit()
+
+        with pytest.raises(IntegrityError):
+            load_demo_dataset(malformed, uploads_directory=uploads_path)
+        db.session.rollback()
+        assert _sqlite_durability() == original
+        db.session.commit()
+
+
 def test_demo_mode_enable_and_disable_restores_snapshot(app_with_storage):
     app, config_path, uploads_path = app_with_storage
 
@@ -84,6 +257,26 @@ def test_demo_mode_enable_and_disable_restores_snapshot(app_with_storage):
         assert persisted["demo_mode"] is False
 
 
+def test_demo_mode_snapshot_follows_symlinked_upload_directories(app_with_storage, tmp_path):
+    app, _, uploads_path = app_with_storage
+
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    (shared / "manual.txt").write_text("shared manual", encoding="utf-8")
+    uploads_path.mkdir(parents=True, exist_ok=True)
+    (uploads_path / "linked").symlink_to(shared, target_is_directory=True)
+
+    with app.app_context():
+        manager = get_demo_manager(current_app)
+        manager.enable()
+        assert not (uploads_path / "linked").exists()
+
+        manager.disable()
+        restored = uploads_path / "linked" / "manual.txt"
+        assert restored.read_text(encoding="utf-8") == "shared manual"
+        assert (shared / "manual.txt").exists()
+
+
 def test_demo_mode_refresh_resets_changes(app_with_storage):
     app, _, uploads_path = app_with_storage
 
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import json
+import os
 import sys
 from pathlib import Path
 from typing import List
@@ -415,3 +416,91 @@ def test_clipboard_debug_toggle_round_trip(tmp_path):
     with reloaded_app.app_context():
         reloaded_config = current_app.config["APP_CONFIG"]
         assert reloaded_config.clipboard_summary.debug_status is True
+
+
+def test_settings_page_reflects_saved_changes(tmp_path):
+    config_data = _default_config()
+    config_path = _write_config(tmp_path / "config.json", config_data)
+
+    app = create_app(config_path)
+    client = app.test_client()
+
+    initial = client.get("/settings")
+    assert initial.status_code == 200
+    assert "Settings Cache Tester" not in initial.get_data(as_text=True)
+
+    response = client.post(
+        "/settings",
+        data=_settings_form_data(
+            config_data, default_submitted_by="Settings Cache Tester"
+        ),
+        follow_redirects=False,
+    )
+    assert response.status_code == 302
+
+    refreshed = client.get("/settings")
+    assert "Settings Cache Tester" in refreshed.get_data(as_text=True)
+
+
+def test_saving_unchanged_settings_skips_rewrite(tmp_path):
+    config_data = _default_config()
+    config_path = _write_config(tmp_path / "config.json", config_data)
+
+    app = create_app(config_path)
+    client = app.test_client()
+    form = _settings_form_data(config_data)
+
+    first = client.post("/settings", data=form, follow_redirects=False)
+    assert first.status_code == 302
+
+    os.utime(config_path, ns=(0, 0))
+    second = client.post("/settings", data=form, follow_redirects=False)
+    assert second.status_code == 302
+    assert config_path.stat().st_mtime_ns == 0
+
+
+def test_settings_page_revalidates_with_etag(tmp_path):
+    config_data = _default_config()
+    config_path = _write_config(tmp_path / "config.json", config_data)
+
+    app = create_app(config_path)
+    client = app.test_client()
+
+    first = client.get("/settings")
+    etag = first.headers["ETag"]
+    assert first.status_code == 200
+
+    cached = client.get("/settings", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.get_data() == b""
+
+    response = client.post(
+        "/settings",
+        data=_settings_form_data(config_data, default_submitted_by="ETag Tester"),
+        follow_redirects=False,
+    )
+    assert response.status_code == 302
+
+    # The redirected page carries a flash message, so it is always rendered.
+    flashed = client.get("/settings", headers={"If-None-Match": etag})
+    assert flashed.status_code == 200
+    assert "ETag" not in flashed.headers
+    assert "Settings updated" in flashed.get_data(as_text=True)
+
+    refreshed = client.get("/settings", headers={"If-None-Match": etag})
+    assert refreshed.status_code == 200
+    assert refreshed.headers["ETag"] != etag
+    assert "ETag Tester" in refreshed.get_data(as_text=True)
+
+
+def test_settings_page_etag_is_shared_across_workers(tmp_path):
+    config_path = _write_config(tmp_path / "config.json", _default_config())
+
+    first_worker = create_app(config_path).test_client()
+    second_worker = create_app(config_path).test_client()
+
+    etag = first_worker.get("/settings").headers["ETag"]
+    assert second_worker.get("/settings").headers["ETag"] == etag
+
+    cached = second_worker.get("/settings", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
@@ -81,3 +81,47 @@ def test_active_filter_excludes_closed_and_cancelled(app):
     assert "Cancelled ticket" not in html
     assert 'option value="Active" selected' in html
 
+
+
+def test_ticket_list_query_count_does_not_grow_with_tickets(app):
+    from sqlalchemy import event
+
+    from tickettracker.extensions import db
+    from tickettracker.models import Tag, Ticket
+
+    def _count_list_queries() -> int:
+        statements = []
+
+        def _record(_conn, _cursor, statement, *_args):
+            statements.append(statement)
+
+        with app.app_context():
+            engine = db.engine
+        event.listen(engine, "before_cursor_execute", _record)
+        try:
+            response = app.test_client().get("/")
+        finally:
+            event.remove(engine, "before_cursor_execute", _record)
+        assert response.status_code == 200
+        return len(statements)
+
+    def _add_tickets(count: int) -> None:
+        with app.app_context():
+            tag = Tag.query.filter_by(name="shared").first() or Tag(name="shared")
+            for index in range(count):
+                ticket = Ticket(
+                    title=f"Ticket {index}",
+                    description="Rendered on the board",
+                    priority="Medium",
+                    status="Open",
+                )
+                ticket.tags.append(tag)
+                ticket.add_update("Initial note", author="Tester")
+                db.session.add(ticket)
+            db.session.commit()
+
+    _add_tickets(2)
+    baseline = _count_list_queries()
+    _add_tickets(5)
+
+    assert _count_list_queries() == baseline
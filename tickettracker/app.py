@@ -1,11 +1,14 @@
 """Flask application factory for TicketTracker."""
 from __future__ import annotations
 
+import os
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from flask import Flask, current_app
+from jinja2 import FileSystemBytecodeCache
 from markupsafe import Markup, escape
+from sqlalchemy.engine import make_url
 
 from .config import AppConfig, load_config
 from .demo import DemoModeError, get_demo_manager
@@ -31,6 +34,26 @@ def linebreaks(value: str | Markup | None) -> Markup:
     return escaped_text.replace("\n", br)
 
 
+def _engine_options(database_uri: str) -> Dict[str, Any]:
+    """Return SQLAlchemy engine options tuned for ``database_uri``."""
+
+    url = make_url(database_uri)
+    if url.get_backend_name() == "sqlite":
+        if url.database in (None, "", ":memory:"):
+            # Flask-SQLAlchemy shares one connection through a StaticPool.
+            return {}
+        # Local file: no network connection can go stale, so skip pre-ping
+        # and recycling and only size the pool for concurrent requests.
+        return {"pool_size": 10, "max_overflow": 20, "pool_timeout": 30}
+    return {
+        "pool_size": 10,
+        "max_overflow": 20,
+        "pool_timeout": 30,
+        "pool_recycle": 1800,
+        "pool_pre_ping": True,
+    }
+
+
 def create_app(config_path: Optional[str | Path] = None) -> Flask:
     """Create and configure the Flask application."""
 
@@ -47,10 +70,26 @@ def create_app(config_path: Optional[str | Path] = None) -> Flask:
 
     app.config["SQLALCHEMY_DATABASE_URI"] = app_config.database_uri
     app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = _engine_options(app_config.database_uri)
     app.config["UPLOAD_FOLDER"] = str(app_config.uploads_path)
     app.config["APP_CONFIG"] = app_config
     app.config["DEMO_MODE"] = app_config.demo_mode
 
+    app.config["JINJA_BYTECODE_CACHE"] = os.environ.get(
+        "TICKETTRACKER_JINJA_CACHE", ""
+    ).strip().lower() in {"1", "true", "yes", "on"}
+
+    # Opt-in: keep compiled templates between restarts so fresh processes
+    # skip the Jinja compile step; entries are keyed on a checksum of the source.
+    if app.config["JINJA_BYTECODE_CACHE"] and not app.testing:
+        jinja_cache_path = Path(app.instance_path) / "jinja_cache"
+        try:
+            jinja_cache_path.mkdir(parents=True, exist_ok=True)
+        except OSError as exc:  # pragma: no cover - read-only instance folder
+            app.logger.warning("Template bytecode cache disabled: %s", exc)
+        else:
+            app.jinja_env.bytecode_cache = FileSystemBytecodeCache(str(jinja_cache_path))
+
     # Ensure the uploads directory exists before the first request.
     uploads_path = app_config.uploads_path
     uploads_path.mkdir(parents=True, exist_ok=True)
@@ -83,6 +122,11 @@ def create_app(config_path: Optional[str | Path] = None) -> Flask:
     app.register_blueprint(tickets_bp)
     app.add_template_filter(linebreaks, name="linebreaks")
 
+    # Compile the settings form once filters are registered so the first
+    # request does not pay for it. Source re-checks stay under Flask's
+    # ``TEMPLATES_AUTO_RELOAD`` control, which is off outside debug mode.
+    app.jinja_env.get_template("settings.html")
+
     @app.context_processor
     def inject_app_config() -> dict[str, AppConfig]:
         return {"app_config": current_app.config["APP_CONFIG"]}
@@ -6,6 +6,7 @@ import math
 import os
 import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional
 
@@ -55,8 +56,14 @@ def normalize_hex_color(value: Any) -> Optional[str]:
 
     if value is None:
         return None
+    return _normalize_hex_text(value if isinstance(value, str) else str(value))
 
-    text = str(value).strip()
+
+@lru_cache(maxsize=512)
+def _normalize_hex_text(text: str) -> Optional[str]:
+    # Palettes repeat the same handful of strings across every settings
+    # render and ticket colour computation, so memoise the parse.
+    text = text.strip()
     if not text:
         return None
 
@@ -1,21 +1,26 @@
 """Demo data loading utilities and demo-mode orchestration."""
 from __future__ import annotations
 
-import json
 import os
 import shutil
+import sqlite3
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing, contextmanager
 from dataclasses import dataclass
 from datetime import date, datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Mapping, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
 
 from flask import Flask, current_app
-from sqlalchemy import delete
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import insert
+from sqlalchemy.orm import Session, scoped_session, selectinload
 
 from .extensions import db
 from .migrations import run_migrations
 from .models import Attachment, Tag, Ticket, TicketTag, TicketUpdate
+from .utils import jsonio
 
 
 class DemoModeError(RuntimeError):
@@ -27,6 +32,17 @@ STATE_FILENAME = "state.json"
 SNAPSHOT_DATABASE_FILENAME = "database.sqlite"
 SNAPSHOT_UPLOADS_DIRNAME = "uploads"
 
+_BACKSLASH_TO_SLASH = str.maketrans("\\", "/")
+
+# Rows per multi-row INSERT. SQLAlchemy still splits pages that would exceed
+# the dialect's bound-parameter limit.
+_INSERT_PAGE_SIZE = 10_000
+
+# Tables replaced by a demo load, children before parents.
+_DEMO_TABLES = tuple(
+    model.__table__ for model in (Attachment, TicketUpdate, TicketTag, Ticket, Tag)
+)
+
 
 @dataclass
 class DemoModeState:
@@ -46,8 +62,8 @@ class DemoModeState:
         if not state_path.exists():
             return cls()
         try:
-            payload = json.loads(state_path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError as exc:
+            payload = jsonio.loads(state_path.read_bytes())
+        except jsonio.JSONDecodeError as exc:
             raise DemoModeError(f"Invalid demo mode state metadata: {exc}") from exc
 
         return cls(
@@ -71,9 +87,7 @@ class DemoModeState:
             "had_database": self.had_database,
             "had_uploads": self.had_uploads,
         }
-        (directory / STATE_FILENAME).write_text(
-            json.dumps(payload, indent=2), encoding="utf-8"
-        )
+        (directory / STATE_FILENAME).write_bytes(jsonio.dumps(payload))
 
 
 def _ensure_app(app: Flask | None = None) -> Flask:
@@ -85,20 +99,30 @@ def _ensure_app(app: Flask | None = None) -> Flask:
         raise DemoModeError("An application context is required for demo operations.") from exc
 
 
+@lru_cache(maxsize=4096)
+def _parse_iso_datetime(text: str) -> datetime:
+    # ``fromisoformat`` only accepts a trailing "Z" from Python 3.11 onwards.
+    parsed = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso_date(text: str) -> date:
+    return date.fromisoformat(text)
+
+
 def _parse_datetime(value: Any) -> datetime | None:
     if value is None:
         return None
     text = str(value).strip()
     if not text:
         return None
-    normalized = text.replace("Z", "+00:00")
     try:
-        parsed = datetime.fromisoformat(normalized)
+        return _parse_iso_datetime(text)
     except ValueError as exc:
         raise DemoModeError(f"Invalid datetime value in demo dataset: {value!r}") from exc
-    if parsed.tzinfo is not None:
-        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
-    return parsed
 
 
 def _parse_date(value: Any) -> date | None:
@@ -108,7 +132,7 @@ def _parse_date(value: Any) -> date | None:
     if not text:
         return None
     try:
-        return date.fromisoformat(text)
+        return _parse_iso_date(text)
     except ValueError as exc:
         raise DemoModeError(f"Invalid date value in demo dataset: {value!r}") from exc
 
@@ -152,19 +176,147 @@ def _normalize_links(value: Any) -> str | None:
     return str(value)
 
 
-def _write_attachment_file(
-    uploads_directory: Path, stored_filename: str, content: Optional[str] = None
-) -> Path:
-    normalized_name = stored_filename.replace("\\", "/").lstrip("/")
+def _resolve_attachment_path(uploads_directory: Path, stored_filename: str) -> Path:
+    normalized_name = stored_filename.translate(_BACKSLASH_TO_SLASH).lstrip("/")
     if not normalized_name:
         raise DemoModeError("Attachment stored filename cannot be empty")
-    target_path = uploads_directory / normalized_name
+    return uploads_directory / normalized_name
+
+
+def _write_attachment_file(target_path: Path, content: Optional[str] = None) -> int:
+    """Write a demo attachment (or placeholder) and return its size in bytes."""
+
     target_path.parent.mkdir(parents=True, exist_ok=True)
-    if content is not None:
-        target_path.write_text(str(content), encoding="utf-8")
-    elif not target_path.exists():
-        target_path.write_text("Demo attachment placeholder", encoding="utf-8")
-    return target_path
+    if content is None:
+        content = "Demo attachment placeholder"
+    target_path.write_text(str(content), encoding="utf-8")
+    return target_path.stat().st_size
+
+
+def _scan_files(directories: Iterable[Path]) -> Dict[Path, os.DirEntry[str]]:
+    """Return the regular files directly inside ``directories`` keyed by path."""
+
+    found: Dict[Path, os.DirEntry[str]] = {}
+    for directory in directories:
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        found[directory / entry.name] = entry
+        except FileNotFoundError:
+            continue
+    return found
+
+
+def _write_attachment_files(files: Mapping[Path, Optional[str]]) -> Dict[Path, int]:
+    """Write demo attachment files concurrently and return their sizes by path.
+
+    Files without content only need a placeholder when nothing is on disk
+    yet; their directories are scanned once instead of checking each path.
+    """
+
+    if not files:
+        return {}
+    existing = _scan_files(
+        {path.parent for path, content in files.items() if content is None}
+    )
+    sizes: Dict[Path, int] = {}
+    pending: Dict[Path, Optional[str]] = {}
+    for path, content in files.items():
+        if content is None and path in existing:
+            sizes[path] = existing[path].stat().st_size
+        else:
+            pending[path] = content
+    if pending:
+        with ThreadPoolExecutor() as executor:
+            written = executor.map(_write_attachment_file, pending.keys(), pending.values())
+            sizes.update(zip(pending.keys(), written))
+    return sizes
+
+
+def _bulk_insert(model: type) -> Any:
+    return insert(model).execution_options(insertmanyvalues_page_size=_INSERT_PAGE_SIZE)
+
+
+def _insert_rows(session: Session, model: type, rows: List[Dict[str, Any]]) -> List[int]:
+    """Insert ``rows`` into the freshly emptied ``model`` table; return ids in row order."""
+
+    if session.get_bind().dialect.insert_returning:
+        return session.scalars(
+            _bulk_insert(model).returning(model.id, sort_by_parameter_order=True), rows
+        ).all()
+    # No INSERT .. RETURNING (SQLite < 3.35, MySQL): the table was just
+    # emptied, so hand out the ids explicitly. Both backends continue their
+    # autoincrement after the largest explicit id.
+    ids = list(range(1, len(rows) + 1))
+    for row, row_id in zip(rows, ids):
+        row["id"] = row_id
+    session.execute(_bulk_insert(model), rows)
+    return ids
+
+
+@contextmanager
+def _bulk_load_transaction(session: Session) -> Iterator[None]:
+    """Run a transaction on ``session`` with SQLite durability relaxed.
+
+    The demo database is thrown away on refresh, so the rollback journal is
+    kept in memory and fsyncs are skipped until the load commits. The
+    connection's previous settings are restored afterwards because pooled
+    connections are reused by the rest of the application.
+    """
+
+    dbapi_connection = None
+    previous: Optional[Tuple[Any, Any]] = None
+    try:
+        with session.begin():
+            connection = session.connection()
+            if connection.dialect.name == "sqlite":
+                # Must run before the first DML statement opens the SQLite
+                # transaction; journal_mode cannot change inside one.
+                previous = (
+                    connection.exec_driver_sql("PRAGMA journal_mode").scalar(),
+                    connection.exec_driver_sql("PRAGMA synchronous").scalar(),
+                )
+                dbapi_connection = connection.connection.dbapi_connection
+                connection.exec_driver_sql("PRAGMA journal_mode=MEMORY")
+                connection.exec_driver_sql("PRAGMA synchronous=OFF")
+            yield
+    finally:
+        if dbapi_connection is not None and previous is not None:
+            journal_mode, synchronous = previous
+            try:
+                dbapi_connection.execute(f"PRAGMA journal_mode={journal_mode}")
+                dbapi_connection.execute(f"PRAGMA synchronous={int(synchronous)}")
+            except sqlite3.Error:  # pragma: no cover - connection was invalidated
+                pass
+
+
+def _has_entries(directory: Path) -> bool:
+    with os.scandir(directory) as entries:
+        return next(entries, None) is not None
+
+
+def _link_tree(source: Path, target: Path) -> None:
+    """Mirror ``source`` into ``target`` using hard links where possible.
+
+    Uploaded files are never rewritten in place, so the live uploads
+    directory and its snapshot can safely share inodes. Files are copied
+    instead when linking fails (e.g. across filesystems). Symlinked
+    directories are followed and mirrored as real directories, matching
+    ``shutil.copytree(symlinks=False)``.
+    """
+
+    for root, _dirs, files in os.walk(source, followlinks=True):
+        root_path = Path(root)
+        destination = target / root_path.relative_to(source)
+        destination.mkdir(parents=True, exist_ok=True)
+        for name in files:
+            source_file = root_path / name
+            target_file = destination / name
+            try:
+                os.link(source_file, target_file)
+            except OSError:
+                shutil.copy2(source_file, target_file)
 
 
 def load_demo_dataset(
@@ -180,131 +332,181 @@ def load_demo_dataset(
     if not dataset.exists():
         raise DemoModeError(f"Demo dataset not found: {dataset}")
 
-    data = json.loads(dataset.read_text(encoding="utf-8"))
+    data = jsonio.parse_document(dataset.read_bytes())
 
     raw_tags = data.get("tags", [])
     raw_tickets = data.get("tickets", [])
 
+    # Resolve the scoped-session registry once so the statements below talk
+    # to the underlying Session directly rather than through the proxy.
     session = session or db.session
+    if isinstance(session, scoped_session):
+        session = session()
     uploads_path = Path(uploads_directory) if uploads_directory else Path(current_app.config["UPLOAD_FOLDER"])
     uploads_path.mkdir(parents=True, exist_ok=True)
 
-    def _populate() -> None:
-        session.execute(delete(Attachment))
-        session.execute(delete(TicketUpdate))
-        session.execute(delete(TicketTag))
-        session.execute(delete(Ticket))
-        session.execute(delete(Tag))
-
-        tag_map: Dict[str, Tag] = {}
-        for tag_data in raw_tags:
-            if not isinstance(tag_data, Mapping):
+    tag_rows: List[Dict[str, Any]] = []
+    for tag_data in raw_tags:
+        if not jsonio.is_mapping(tag_data):
+            continue
+        name = str(tag_data.get("name", "")).strip()
+        if not name:
+            continue
+        tag_rows.append({"name": name, "color": tag_data.get("color")})
+
+    # Rows are collected up front; child rows reference their parents by
+    # index until the parent INSERTs return database ids.
+    ticket_rows: List[Dict[str, Any]] = []
+    ticket_tag_names: List[Tuple[int, str]] = []
+    update_rows: List[Dict[str, Any]] = []
+    update_ticket_indexes: List[int] = []
+    attachment_rows: List[Dict[str, Any]] = []
+    attachment_owners: List[Tuple[int, Optional[int]]] = []
+    attachment_paths: List[Path] = []
+    attachment_files: Dict[Path, Optional[str]] = {}
+
+    # Rows without timestamps share a single load time.
+    loaded_at = datetime.utcnow()
+    loaded_on = loaded_at.date()
+
+    def _collect_attachments(
+        raw_attachments: Iterable[Any],
+        ticket_index: int,
+        update_index: Optional[int],
+        fallback_uploaded_at: datetime,
+    ) -> None:
+        for attachment_data in raw_attachments:
+            if not jsonio.is_mapping(attachment_data):
                 continue
-            name = str(tag_data.get("name", "")).strip()
-            if not name:
+            stored_filename = str(attachment_data.get("stored_filename", "")).strip()
+            if not stored_filename:
                 continue
-            tag = Tag(name=name, color=tag_data.get("color"))
-            session.add(tag)
-            tag_map[name] = tag
+            target_path = _resolve_attachment_path(uploads_path, stored_filename)
+            content = attachment_data.get("content")
+            if content is not None or target_path not in attachment_files:
+                attachment_files[target_path] = content
+            attachment_rows.append(
+                {
+                    "original_filename": attachment_data.get("original_filename")
+                    or Path(stored_filename).name,
+                    "stored_filename": stored_filename,
+                    "mimetype": attachment_data.get("mimetype"),
+                    "size": attachment_data.get("size"),
+                    "uploaded_at": _parse_datetime(attachment_data.get("uploaded_at"))
+                    or fallback_uploaded_at,
+                }
+            )
+            attachment_owners.append((ticket_index, update_index))
+            attachment_paths.append(target_path)
 
-        session.flush()
+    for ticket_data in raw_tickets:
+        if not jsonio.is_mapping(ticket_data):
+            continue
+        title = str(ticket_data.get("title", "")).strip()
+        description = str(ticket_data.get("description", "")).strip()
+        if not title or not description:
+            continue
 
-        for ticket_data in raw_tickets:
-            if not isinstance(ticket_data, Mapping):
-                continue
-            title = str(ticket_data.get("title", "")).strip()
-            description = str(ticket_data.get("description", "")).strip()
-            if not title or not description:
+        watchers = _normalize_watchers(ticket_data.get("watchers"))
+        ticket_row = {
+            "title": title,
+            "description": description,
+            "requester": ticket_data.get("requester"),
+            "_watchers": ", ".join(watchers) or None,
+            "priority": str(ticket_data.get("priority", "Medium") or "Medium"),
+            "status": str(ticket_data.get("status", "Open") or "Open"),
+            "due_date": _parse_datetime(ticket_data.get("due_date")),
+            "notes": ticket_data.get("notes"),
+            "links": _normalize_links(ticket_data.get("links")),
+            "on_hold_reason": ticket_data.get("on_hold_reason"),
+            "created_at": _parse_datetime(ticket_data.get("created_at")) or loaded_at,
+            "updated_at": _parse_datetime(ticket_data.get("updated_at")) or loaded_at,
+            "age_reference_date": _parse_date(ticket_data.get("age_reference_date"))
+            or loaded_on,
+        }
+        ticket_index = len(ticket_rows)
+        ticket_rows.append(ticket_row)
+
+        for name in ticket_data.get("tags", []):
+            ticket_tag_names.append((ticket_index, str(name).strip()))
+
+        for update_data in ticket_data.get("updates", []):
+            if not jsonio.is_mapping(update_data):
                 continue
+            update_row = {
+                "body": str(update_data.get("body", "")).strip() or "Update",
+                "author": update_data.get("author"),
+                "created_at": _parse_datetime(update_data.get("created_at")) or loaded_at,
+                "status_from": update_data.get("status_from"),
+                "status_to": update_data.get("status_to"),
+                "is_system": bool(update_data.get("is_system", False)),
+            }
+            update_index = len(update_rows)
+            update_rows.append(update_row)
+            update_ticket_indexes.append(ticket_index)
+            _collect_attachments(
+                update_data.get("attachments", []),
+                ticket_index,
+                update_index,
+                update_row["created_at"],
+            )
 
-            ticket = Ticket(
-                title=title,
-                description=description,
-                requester=ticket_data.get("requester"),
-                priority=str(ticket_data.get("priority", "Medium") or "Medium"),
-                status=str(ticket_data.get("status", "Open") or "Open"),
-                due_date=_parse_datetime(ticket_data.get("due_date")),
-                notes=ticket_data.get("notes"),
-                links=_normalize_links(ticket_data.get("links")),
-                on_hold_reason=ticket_data.get("on_hold_reason"),
-                created_at=_parse_datetime(ticket_data.get("created_at")) or datetime.utcnow(),
-                updated_at=_parse_datetime(ticket_data.get("updated_at")) or datetime.utcnow(),
-                age_reference_date=_parse_date(ticket_data.get("age_reference_date")),
+        _collect_attachments(
+            ticket_data.get("attachments", []),
+            ticket_index,
+            None,
+            ticket_row["created_at"],
+        )
+
+    # Attachment files are written before the transaction opens so slow disk
+    # I/O never holds the database write lock.
+    file_sizes = _write_attachment_files(attachment_files)
+    for attachment_row, target_path in zip(attachment_rows, attachment_paths):
+        attachment_row["size"] = int(attachment_row["size"] or file_sizes[target_path])
+
+    def _populate() -> None:
+        # SQLite's truncate optimisation makes an unconditional DELETE cost
+        # O(pages) rather than O(rows).
+        for table in _DEMO_TABLES:
+            session.execute(table.delete())
+
+        tag_ids: Dict[str, int] = {}
+        if tag_rows:
+            tag_ids = dict(
+                zip((row["name"] for row in tag_rows), _insert_rows(session, Tag, tag_rows))
             )
 
-            watchers = _normalize_watchers(ticket_data.get("watchers"))
-            if watchers:
-                ticket.watchers = watchers
-
-            session.add(ticket)
-            session.flush()
-
-            tag_names = [str(name) for name in ticket_data.get("tags", []) if str(name).strip()]
-            resolved_tags = [tag_map[name.strip()] for name in tag_names if name.strip() in tag_map]
-            if resolved_tags:
-                ticket.tags = resolved_tags
-
-            updates = ticket_data.get("updates", [])
-            for update_data in updates:
-                if not isinstance(update_data, Mapping):
-                    continue
-                update = TicketUpdate(
-                    ticket=ticket,
-                    body=str(update_data.get("body", "")).strip() or "Update",
-                    author=update_data.get("author"),
-                    created_at=_parse_datetime(update_data.get("created_at")) or datetime.utcnow(),
-                    status_from=update_data.get("status_from"),
-                    status_to=update_data.get("status_to"),
-                    is_system=bool(update_data.get("is_system", False)),
-                )
-                session.add(update)
-                session.flush()
-
-                attachments = update_data.get("attachments", [])
-                for attachment_data in attachments:
-                    if not isinstance(attachment_data, Mapping):
-                        continue
-                    stored_filename = str(attachment_data.get("stored_filename", "")).strip()
-                    if not stored_filename:
-                        continue
-                    content = attachment_data.get("content")
-                    file_path = _write_attachment_file(uploads_path, stored_filename, content)
-                    attachment = Attachment(
-                        ticket=ticket,
-                        update=update,
-                        original_filename=attachment_data.get("original_filename")
-                        or Path(stored_filename).name,
-                        stored_filename=stored_filename,
-                        mimetype=attachment_data.get("mimetype"),
-                        size=int(attachment_data.get("size" or 0) or file_path.stat().st_size),
-                        uploaded_at=_parse_datetime(attachment_data.get("uploaded_at"))
-                        or update.created_at,
-                    )
-                    session.add(attachment)
-
-            ticket_level_attachments = ticket_data.get("attachments", [])
-            for attachment_data in ticket_level_attachments:
-                if not isinstance(attachment_data, Mapping):
-                    continue
-                stored_filename = str(attachment_data.get("stored_filename", "")).strip()
-                if not stored_filename:
-                    continue
-                content = attachment_data.get("content")
-                file_path = _write_attachment_file(uploads_path, stored_filename, content)
-                attachment = Attachment(
-                    ticket=ticket,
-                    original_filename=attachment_data.get("original_filename")
-                    or Path(stored_filename).name,
-                    stored_filename=stored_filename,
-                    mimetype=attachment_data.get("mimetype"),
-                    size=int(attachment_data.get("size" or 0) or file_path.stat().st_size),
-                    uploaded_at=_parse_datetime(attachment_data.get("uploaded_at"))
-                    or ticket.created_at,
+        if not ticket_rows:
+            return
+
+        ticket_ids = _insert_rows(session, Ticket, ticket_rows)
+
+        ticket_tag_rows = [
+            {"ticket_id": ticket_ids[ticket_index], "tag_id": tag_ids[name]}
+            for ticket_index, name in dict.fromkeys(ticket_tag_names)
+            if name in tag_ids
+        ]
+        if ticket_tag_rows:
+            session.execute(_bulk_insert(TicketTag), ticket_tag_rows)
+
+        update_ids: List[int] = []
+        if update_rows:
+            for update_row, ticket_index in zip(update_rows, update_ticket_indexes):
+                update_row["ticket_id"] = ticket_ids[ticket_index]
+            update_ids = _insert_rows(session, TicketUpdate, update_rows)
+
+        if attachment_rows:
+            for attachment_row, (ticket_index, update_index) in zip(
+                attachment_rows, attachment_owners
+            ):
+                attachment_row["ticket_id"] = ticket_ids[ticket_index]
+                attachment_row["update_id"] = (
+                    None if update_index is None else update_ids[update_index]
                 )
-                session.add(attachment)
+            session.execute(_bulk_insert(Attachment), attachment_rows)
 
     if use_transaction:
-        with session.begin():
+        with _bulk_load_transaction(session):
             _populate()
     else:
         _populate()
@@ -323,6 +525,7 @@ class DemoModeManager:
         self._last_loaded: datetime | None = (
             _parse_datetime(self.state.last_loaded_at) if self.state.last_loaded_at else None
         )
+        self._resolved_paths: Dict[str, Path] = {}
 
     @property
     def is_active(self) -> bool:
@@ -338,8 +541,16 @@ class DemoModeManager:
             raise DemoModeError(f"Demo dataset missing: {dataset}")
         return dataset
 
+    def _resolve(self, raw_path: str) -> Path:
+        # Keyed by the configured value, so a changed setting is picked up
+        # without explicit invalidation while repeat toggles skip the stats.
+        resolved = self._resolved_paths.get(raw_path)
+        if resolved is None:
+            resolved = self._resolved_paths[raw_path] = Path(raw_path).resolve()
+        return resolved
+
     def _uploads_path(self) -> Path:
-        return Path(self.app.config["UPLOAD_FOLDER"]).resolve()
+        return self._resolve(str(self.app.config["UPLOAD_FOLDER"]))
 
     def _database_path(self) -> Path:
         uri = str(self.app.config.get("SQLALCHEMY_DATABASE_URI", ""))
@@ -347,9 +558,7 @@ class DemoModeManager:
             raise DemoModeError("Demo mode does not support in-memory SQLite databases.")
         if not uri.startswith("sqlite:///"):
             raise DemoModeError("Demo mode currently supports only SQLite database URIs.")
-        raw_path = uri.replace("sqlite:///", "", 1)
-        db_path = Path(raw_path)
-        return db_path.resolve()
+        return self._resolve(uri.replace("sqlite:///", "", 1))
 
     def _dispose_engine(self) -> None:
         db.session.remove()
@@ -360,8 +569,18 @@ class DemoModeManager:
         engine.dispose()
 
     def _copy_database(self, source: Path, target: Path) -> None:
-        if source.exists():
-            target.parent.mkdir(parents=True, exist_ok=True)
+        if not source.exists():
+            return
+        target.parent.mkdir(parents=True, exist_ok=True)
+        # The SQLite backup API yields a consistent copy even if pages are
+        # still held in a journal; fall back to a plain copy for files
+        # SQLite cannot open.
+        try:
+            with closing(sqlite3.connect(source)) as source_conn, closing(
+                sqlite3.connect(target)
+            ) as target_conn:
+                source_conn.backup(target_conn)
+        except sqlite3.DatabaseError:
             shutil.copy2(source, target)
 
     def _clear_uploads(self, path: Path) -> None:
@@ -387,12 +606,12 @@ class DemoModeManager:
         self._dispose_engine()
         self._copy_database(db_path, snapshot_db)
         if uploads_path.exists():
-            shutil.copytree(uploads_path, snapshot_uploads)
+            _link_tree(uploads_path, snapshot_uploads)
         else:
             snapshot_uploads.mkdir(parents=True, exist_ok=True)
 
         self.state.had_database = db_path.exists()
-        self.state.had_uploads = uploads_path.exists() and any(uploads_path.iterdir())
+        self.state.had_uploads = uploads_path.exists() and _has_entries(uploads_path)
         self.state.database_uri = str(self.app.config.get("SQLALCHEMY_DATABASE_URI"))
         self.state.uploads_directory = str(uploads_path)
 
@@ -414,7 +633,7 @@ class DemoModeManager:
 
         self._clear_uploads(uploads_path)
         if self.state.had_uploads and snapshot_uploads.exists():
-            shutil.copytree(snapshot_uploads, uploads_path, dirs_exist_ok=True)
+            _link_tree(snapshot_uploads, uploads_path)
 
     def enable(self) -> None:
         """Enable demo mode, snapshotting live data on first activation."""
@@ -488,10 +707,10 @@ class DemoModeManager:
         uploads_path = self._uploads_path()
 
         try:
-            existing_payload = json.loads(dataset_path.read_text(encoding="utf-8"))
+            existing_payload = jsonio.loads(dataset_path.read_bytes())
         except FileNotFoundError:
             existing_payload = {}
-        except json.JSONDecodeError:
+        except jsonio.JSONDecodeError:
             existing_payload = {}
 
         timestamp = datetime.utcnow().replace(tzinfo=timezone.utc)
@@ -510,14 +729,17 @@ class DemoModeManager:
         def _format_date(value: date | None) -> str | None:
             return value.isoformat() if value else None
 
-        uploads_root = uploads_path
+        # Stored names are normally already relative, so a prefix check avoids
+        # paying for Path.relative_to's exception on every attachment.
+        # normcase keeps the comparison case-insensitive on Windows.
+        uploads_prefix = os.path.normcase(os.path.join(uploads_path, ""))
 
         def _relative_stored_name(stored: str) -> str:
             candidate = Path(stored)
-            try:
-                return candidate.relative_to(uploads_root).as_posix()
-            except ValueError:
-                return candidate.as_posix()
+            posix_name = candidate.as_posix()
+            if os.path.normcase(str(candidate)).startswith(uploads_prefix):
+                return posix_name[len(uploads_prefix) :]
+            return posix_name
 
         def _serialize_attachment(attachment: Attachment) -> Dict[str, Any]:
             data: Dict[str, Any] = {
@@ -538,15 +760,25 @@ class DemoModeManager:
             return data
 
         ticket_query = (
-            Ticket.query.options(
-                selectinload(Ticket.tags),
-                selectinload(Ticket.updates).selectinload(TicketUpdate.attachments),
-                selectinload(Ticket.attachments),
-            )
-            .order_by(Ticket.id)
-            .all()
+            Ticket.query.options(selectinload(Ticket.tags)).order_by(Ticket.id).all()
         )
 
+        # Group updates and attachments in one ordered pass each so the
+        # serialization loop below only performs dictionary lookups.
+        updates_by_ticket: Dict[int, List[TicketUpdate]] = defaultdict(list)
+        for update in TicketUpdate.query.order_by(
+            TicketUpdate.ticket_id, TicketUpdate.created_at, TicketUpdate.id
+        ):
+            updates_by_ticket[update.ticket_id].append(update)
+
+        attachments_by_update: Dict[int, List[Attachment]] = defaultdict(list)
+        attachments_by_ticket: Dict[int, List[Attachment]] = defaultdict(list)
+        for attachment in Attachment.query.order_by(Attachment.id):
+            if attachment.update_id is None:
+                attachments_by_ticket[attachment.ticket_id].append(attachment)
+            else:
+                attachments_by_update[attachment.update_id].append(attachment)
+
         tickets_payload: List[Dict[str, Any]] = []
         for ticket in ticket_query:
             ticket_data: Dict[str, Any] = {
@@ -584,7 +816,7 @@ class DemoModeManager:
                 ticket_data["tags"] = tag_names
 
             updates_payload: List[Dict[str, Any]] = []
-            for update in ticket.updates:
+            for update in updates_by_ticket.get(ticket.id, ()):
                 update_data: Dict[str, Any] = {
                     "body": update.body,
                 }
@@ -602,7 +834,7 @@ class DemoModeManager:
 
                 update_attachments = [
                     _serialize_attachment(att)
-                    for att in sorted(update.attachments, key=lambda item: item.id or 0)
+                    for att in attachments_by_update.get(update.id, ())
                 ]
                 if update_attachments:
                     update_data["attachments"] = update_attachments
@@ -613,8 +845,7 @@ class DemoModeManager:
 
             ticket_level_attachments = [
                 _serialize_attachment(attachment)
-                for attachment in sorted(ticket.attachments, key=lambda item: item.id or 0)
-                if attachment.update_id is None
+                for attachment in attachments_by_ticket.get(ticket.id, ())
             ]
             if ticket_level_attachments:
                 ticket_data["attachments"] = ticket_level_attachments
@@ -635,7 +866,7 @@ class DemoModeManager:
         }
 
         dataset_path.parent.mkdir(parents=True, exist_ok=True)
-        dataset_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        dataset_path.write_bytes(jsonio.dumps(payload))
 
         self._last_loaded = timestamp
         self.state.last_loaded_at = timestamp.isoformat()
@@ -652,13 +883,11 @@ class DemoModeManager:
     def status(self) -> Dict[str, Any]:
         """Return runtime status metadata for presentation layers."""
 
-        try:
-            dataset = str(self._dataset())
-        except DemoModeError:
-            dataset = str(self.dataset_path)
+        # The configured path is reported whether or not the file exists, so
+        # rendering the status needs no filesystem access.
         return {
             "active": self.state.active,
-            "dataset": dataset,
+            "dataset": str(self.dataset_path),
             "snapshot_root": str(self.snapshot_root),
             "last_loaded_at": self._last_loaded,
         }
@@ -1,8 +1,9 @@
 """Lightweight schema migration utilities for TicketTracker."""
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Dict, Iterable, List, Tuple
 
 from flask import current_app
 
@@ -23,6 +24,18 @@ def run_migrations() -> None:
         _ensure_ticket_age_reference(engine, inspector)
     if "attachments" in table_names:
         _ensure_attachment_metadata(engine, inspector)
+    _ensure_indexes(engine, table_names)
+
+
+def _ensure_indexes(engine, table_names) -> None:
+    # ``create_all`` only creates indexes alongside new tables, so add any
+    # declared since an existing database was created.
+    with engine.begin() as connection:
+        for table in db.metadata.sorted_tables:
+            if table.name not in table_names:
+                continue
+            for index in table.indexes:
+                index.create(connection, checkfirst=True)
 
 
 def _ensure_ticket_age_reference(engine, inspector) -> None:
@@ -72,9 +85,7 @@ def _backfill_attachment_metadata(engine) -> None:
             select(Attachment).order_by(Attachment.id.asc())
         )
 
-        canonical: Dict[str, Tuple[str, str]] = {}
-        dirty = False
-
+        candidates: List[Tuple[Attachment, Path]] = []
         for attachment in attachments:
             stored_filename = attachment.stored_filename
             if not stored_filename:
@@ -83,17 +94,26 @@ def _backfill_attachment_metadata(engine) -> None:
             file_path = upload_root / stored_filename
             if not file_path.exists():
                 continue
+            candidates.append((attachment, file_path))
+
+        computed = _compute_checksums(
+            file_path for attachment, file_path in candidates if not attachment.checksum
+        )
+
+        canonical: Dict[str, Tuple[str, str]] = {}
+        dirty = False
 
+        for attachment, file_path in candidates:
             checksum = attachment.checksum
             if not checksum:
-                checksum = compute_file_sha256(file_path)
+                checksum = computed[file_path]
                 attachment.checksum = checksum
                 dirty = True
 
             canonical_entry = canonical.get(checksum)
             if canonical_entry is None:
                 file_uuid = attachment.file_uuid or generate_uuid7()
-                canonical_entry = (file_uuid, stored_filename)
+                canonical_entry = (file_uuid, attachment.stored_filename)
                 canonical[checksum] = canonical_entry
 
             file_uuid = canonical_entry[0]
@@ -104,3 +124,19 @@ def _backfill_attachment_metadata(engine) -> None:
         if dirty:
             session.commit()
 
+
+def _compute_checksums(paths: Iterable[Path]) -> Dict[Path, str]:
+    """Hash each unique path, spreading the work across a thread pool.
+
+    ``hashlib`` releases the GIL while digesting large buffers, so threads
+    scale across cores without the start-up and pickling cost of a process
+    pool during application start.
+    """
+
+    unique_paths = list(dict.fromkeys(paths))
+    if len(unique_paths) <= 1:
+        return {path: compute_file_sha256(path) for path in unique_paths}
+
+    with ThreadPoolExecutor() as executor:
+        checksums = executor.map(compute_file_sha256, unique_paths)
+        return dict(zip(unique_paths, checksums))
@@ -2,14 +2,29 @@
 from __future__ import annotations
 
 from datetime import date, datetime
-from typing import Iterable, List, Sequence
+from functools import lru_cache
+from typing import Dict, Iterable, List, Sequence, Tuple
 
-from sqlalchemy import event
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import event, insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Mapped, Session, mapped_column, object_session, relationship
 
 from .extensions import db
 
 
+_TAG_CACHE_KEY = "tickettracker.resolved_tags"
+
+# Dialect inserts supporting ``ON CONFLICT DO NOTHING``.
+_UPSERT_INSERTS = {"postgresql": postgresql_insert, "sqlite": sqlite_insert}
+
+
+@lru_cache(maxsize=1024)
+def _split_watchers(raw: str) -> Tuple[str, ...]:
+    # Keyed on the stored string, so edits never see a stale parse.
+    return tuple(part for part in map(str.strip, raw.split(",")) if part)
+
+
 class TicketTag(db.Model):
     """Association table between tickets and tags."""
 
@@ -24,6 +39,10 @@ class Ticket(db.Model):
     """Primary ticket object representing a task or request."""
 
     __tablename__ = "tickets"
+    __table_args__ = (
+        db.Index("ix_tickets_status_due", "status", "due_date"),
+        db.Index("ix_tickets_updated_at", "updated_at"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     title: Mapped[str] = mapped_column(db.String(255), nullable=False)
@@ -58,14 +77,15 @@ class Ticket(db.Model):
     def watchers(self) -> List[str]:
         if not self._watchers:
             return []
-        return [part.strip() for part in self._watchers.split(",") if part.strip()]
+        return list(_split_watchers(self._watchers))
 
     @watchers.setter
     def watchers(self, value: str | Sequence[str]) -> None:
         if isinstance(value, str):
-            self._watchers = value
+            self._watchers = value or None
         else:
-            self._watchers = ", ".join(part.strip() for part in value if part)
+            parts = [part.strip() for part in value if part and part.strip()]
+            self._watchers = ", ".join(parts) or None
 
     @property
     def tag_names(self) -> List[str]:
@@ -77,17 +97,8 @@ class Ticket(db.Model):
             self.tags = []
             return
 
-        existing = {tag.name: tag for tag in Tag.query.filter(Tag.name.in_(normalized)).all()}
-
-        new_tags: List[Tag] = []
-        for name in normalized:
-            if name in existing:
-                new_tags.append(existing[name])
-            else:
-                tag = Tag(name=name)
-                db.session.add(tag)
-                new_tags.append(tag)
-        self.tags = new_tags
+        resolved = _resolve_tags(normalized)
+        self.tags = [resolved[name] for name in normalized]
 
     def add_update(
         self,
@@ -114,6 +125,9 @@ class TicketUpdate(db.Model):
     """Chronological updates associated with a ticket."""
 
     __tablename__ = "ticket_updates"
+    __table_args__ = (
+        db.Index("ix_ticket_updates_ticket_created", "ticket_id", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     ticket_id: Mapped[int] = mapped_column(db.Integer, db.ForeignKey("tickets.id"), nullable=False)
@@ -166,6 +180,71 @@ class Tag(db.Model):
     tickets: Mapped[List[Ticket]] = relationship("Ticket", secondary="ticket_tags", back_populates="tags")
 
 
+def _tag_cache(session: Session) -> Dict[str, Tag]:
+    # Keyed on the current transaction so a commit or rollback (including a
+    # savepoint's) starts a fresh cache without any session-wide listeners.
+    transaction = (
+        session.get_nested_transaction() or session.get_transaction() or session.begin()
+    )
+    cached = session.info.get(_TAG_CACHE_KEY)
+    if cached is None or cached[0] is not transaction:
+        cached = session.info[_TAG_CACHE_KEY] = (transaction, {})
+    return cached[1]
+
+
+def _resolve_tags(names: set[str]) -> Dict[str, Tag]:
+    """Return tags for ``names``, creating any that do not exist yet.
+
+    Resolved tags are remembered on the session until its transaction ends,
+    so tagging several tickets within one request only queries for names it
+    has not seen before.
+    """
+
+    cache = _tag_cache(db.session())
+    missing = names.difference(cache)
+    if missing:
+        dialect = db.session.get_bind().dialect
+        upsert = _UPSERT_INSERTS.get(dialect.name)
+        if upsert is not None:
+            # Create missing tags first so two requests adding the same new
+            # tag cannot trip the unique constraint, then load them all.
+            db.session.execute(
+                upsert(Tag)
+                .values([{"name": name} for name in missing])
+                .on_conflict_do_nothing(index_elements=["name"])
+            )
+            cache.update((tag.name, tag) for tag in Tag.query.filter(Tag.name.in_(missing)))
+        else:
+            found = {tag.name: tag for tag in Tag.query.filter(Tag.name.in_(missing))}
+            created = [name for name in missing if name not in found]
+            if created:
+                # One multi-row INSERT rather than a flush per tag; backends
+                # without RETURNING (MySQL/MariaDB) re-select the new rows.
+                rows = [{"name": name} for name in created]
+                if dialect.insert_returning:
+                    new_tags = db.session.scalars(insert(Tag).returning(Tag), rows)
+                else:
+                    db.session.execute(insert(Tag), rows)
+                    new_tags = Tag.query.filter(Tag.name.in_(created))
+                found.update((tag.name, tag) for tag in new_tags)
+            cache.update(found)
+    return {name: cache[name] for name in names}
+
+
+@event.listens_for(db.session, "do_orm_execute")
+def _forget_tags_on_delete(orm_execute_state) -> None:
+    # Bulk and Core DELETEs (e.g. the demo loader) bypass the identity map.
+    if orm_execute_state.is_delete:
+        orm_execute_state.session.info.pop(_TAG_CACHE_KEY, None)
+
+
+@event.listens_for(Tag, "after_delete")
+def _forget_deleted_tag(mapper, connection, target: Tag) -> None:
+    session = object_session(target)
+    if session is not None:
+        session.info.pop(_TAG_CACHE_KEY, None)
+
+
 @event.listens_for(Ticket, "before_update")
 def _touch_ticket(mapper, connection, target: Ticket) -> None:  # pragma: no cover - SQLAlchemy hook
     target.updated_at = datetime.utcnow()
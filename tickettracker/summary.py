@@ -1,11 +1,14 @@
 """Utilities for composing clipboard-ready ticket summaries."""
 from __future__ import annotations
 
+import heapq
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, Iterable, List, Sequence
+from functools import lru_cache
+from typing import Dict, Iterable, List, Sequence, Tuple
 
 from flask import render_template
+from sqlalchemy import inspect
 
 from .config import AppConfig
 from .models import Ticket, TicketUpdate
@@ -24,6 +27,10 @@ CLIPBOARD_SUMMARY_SECTION_DESCRIPTIONS: Dict[str, str] = {
 }
 
 
+_HTML_TEMPLATE = "partials/ticket_clipboard_summary.html"
+_TEXT_TEMPLATE = "partials/ticket_clipboard_summary.txt"
+
+
 @dataclass
 class TicketClipboardSummary:
     """Rendered clipboard payload for a ticket."""
@@ -32,26 +39,45 @@ class TicketClipboardSummary:
     text: str
 
 
-def _normalize_sections(values: Iterable[str]) -> List[str]:
+def _normalize_sections(values: Iterable[str]) -> Tuple[str, ...]:
+    return _normalize_section_names(tuple(str(value or "") for value in values))
+
+
+@lru_cache(maxsize=32)
+def _normalize_section_names(values: Tuple[str, ...]) -> Tuple[str, ...]:
+    # Section lists come from configuration, so every render of the same
+    # settings reuses one normalized tuple.
     sections: List[str] = []
+    seen: set[str] = set()
     for value in values:
-        text = str(value or "").strip().lower()
-        if not text or text in sections:
+        text = value.strip().lower()
+        if not text or text in seen:
             continue
         sections.append(text)
-    return sections
+        seen.add(text)
+    return tuple(sections)
 
 
 def _recent_updates(ticket: Ticket, limit: int) -> List[TicketUpdate]:
     if limit <= 0:
         return []
 
-    updates = sorted(
+    if ticket.id is not None and "updates" in inspect(ticket).unloaded:
+        # Let the database pick the newest rows rather than hydrating the
+        # whole timeline just to discard most of it.
+        return (
+            TicketUpdate.query.filter(TicketUpdate.ticket_id == ticket.id)
+            .order_by(TicketUpdate.created_at.desc(), TicketUpdate.id.desc())
+            .limit(limit)
+            .all()
+        )
+
+    # Break created_at ties on id, newest first, to match the query above.
+    return heapq.nlargest(
+        limit,
         ticket.updates,
-        key=lambda update: update.created_at or datetime.min,
-        reverse=True,
+        key=lambda update: (update.created_at or datetime.min, update.id or 0),
     )
-    return updates[:limit]
 
 
 def build_ticket_clipboard_summary(
@@ -77,22 +103,16 @@ def build_ticket_clipboard_summary(
 
     available_sections = summary_config.available_sections()
 
-    html = render_template(
-        "partials/ticket_clipboard_summary.html",
-        ticket=ticket,
-        config=config,
-        sections=resolved_html_sections,
-        updates=updates,
-        available_sections=available_sections,
-    ).strip()
-
-    text = render_template(
-        "partials/ticket_clipboard_summary.txt",
-        ticket=ticket,
-        config=config,
-        sections=resolved_text_sections,
-        updates=updates,
-        available_sections=available_sections,
-    ).strip()
+    # Both payloads share one context; render_template keeps Flask's
+    # template signals firing for each render.
+    context = {
+        "ticket": ticket,
+        "config": config,
+        "updates": updates,
+        "available_sections": available_sections,
+    }
+
+    html = render_template(_HTML_TEMPLATE, **context, sections=resolved_html_sections).strip()
+    text = render_template(_TEXT_TEMPLATE, **context, sections=resolved_text_sections).strip()
 
     return TicketClipboardSummary(html=html, text=text)
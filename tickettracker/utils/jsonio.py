@@ -0,0 +1,62 @@
+"""JSON encoding helpers that prefer optional accelerated backends."""
+from __future__ import annotations
+
+import json
+from collections.abc import Mapping
+from typing import Any
+
+try:  # pragma: no cover - exercised only when the optional dependency exists
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None  # type: ignore[assignment]
+
+try:  # pragma: no cover - exercised only when the optional dependency exists
+    import simdjson
+except ImportError:  # pragma: no cover - eager parsing fallback
+    simdjson = None  # type: ignore[assignment]
+
+
+# ``orjson.JSONDecodeError`` subclasses the stdlib error, so callers can catch
+# this single type regardless of the backend in use.
+JSONDecodeError = json.JSONDecodeError
+
+_MAPPING_TYPES: tuple[type, ...] = (Mapping,)
+if simdjson is not None:  # pragma: no cover - optional dependency
+    _MAPPING_TYPES = (Mapping, simdjson.Object)
+
+
+def loads(data: bytes | str) -> Any:
+    """Deserialize ``data`` (UTF-8 bytes or text) into Python objects."""
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize ``obj`` as two-space indented UTF-8 encoded JSON."""
+
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def parse_document(data: bytes) -> Any:
+    """Return a read-only view of ``data`` for key-selective traversal.
+
+    With ``pysimdjson`` installed, objects and arrays are decoded lazily so
+    only the values that are accessed become Python objects. A new parser is
+    used per call because a simdjson parser cannot be reused while proxies
+    from its previous document are still alive. Without it, this is
+    equivalent to :func:`loads`.
+    """
+
+    if simdjson is not None:
+        return simdjson.Parser().parse(data)
+    return loads(data)
+
+
+def is_mapping(value: Any) -> bool:
+    """Return ``True`` for JSON objects from :func:`loads` or :func:`parse_document`."""
+
+    return isinstance(value, _MAPPING_TYPES)
@@ -2,14 +2,22 @@
 from __future__ import annotations
 
 import hashlib
+import mmap
 import os
 import time
 import uuid
 from pathlib import Path
-from typing import BinaryIO
+from typing import BinaryIO, Tuple
 
 
-_DEFAULT_CHUNK_SIZE = 1024 * 1024
+# ``hashlib.sha256`` is OpenSSL's implementation, which already uses the CPU's
+# SHA extensions where available; larger reads keep the per-chunk Python
+# overhead small relative to the hashing itself.
+_DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+
+_UUID7_TIMESTAMP_MASK = (1 << 48) - 1
+_UUID7_CLEAR_MASK = ~((0xF << 76) | (0x3 << 62))
+_UUID7_VERSION_VARIANT = (0x7 << 76) | (0x2 << 62)
 
 
 def generate_uuid7() -> str:
@@ -18,19 +26,30 @@ def generate_uuid7() -> str:
     if hasattr(uuid, "uuid7"):
         return str(uuid.uuid7())  # type: ignore[attr-defined]
 
-    timestamp_ms = int(time.time() * 1000)
-    timestamp_bytes = timestamp_ms.to_bytes(6, "big", signed=False)
-    random_bytes = os.urandom(10)
-    uuid_bytes = bytearray(timestamp_bytes + random_bytes)
-    uuid_bytes[6] = (uuid_bytes[6] & 0x0F) | 0x70
-    uuid_bytes[8] = (uuid_bytes[8] & 0x3F) | 0x80
-    return str(uuid.UUID(bytes=bytes(uuid_bytes)))
+    # 48-bit millisecond timestamp followed by 80 random bits, with the
+    # version (7) and RFC 4122 variant bits set in place.
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = ((timestamp_ms & _UUID7_TIMESTAMP_MASK) << 80) | int.from_bytes(
+        os.urandom(10), "big"
+    )
+    value = (value & _UUID7_CLEAR_MASK) | _UUID7_VERSION_VARIANT
+    return str(uuid.UUID(int=value))
 
 
 def compute_stream_sha256(stream: BinaryIO, *, chunk_size: int = _DEFAULT_CHUNK_SIZE) -> str:
     """Compute a SHA-256 checksum from a stream without exhausting memory."""
 
+    checksum, _size = compute_stream_sha256_and_size(stream, chunk_size=chunk_size)
+    return checksum
+
+
+def compute_stream_sha256_and_size(
+    stream: BinaryIO, *, chunk_size: int = _DEFAULT_CHUNK_SIZE
+) -> Tuple[str, int]:
+    """Return the SHA-256 checksum and byte length of a stream in one pass."""
+
     digest = hashlib.sha256()
+    size = 0
     can_seek = hasattr(stream, "seek")
 
     if can_seek:
@@ -44,18 +63,32 @@ def compute_stream_sha256(stream: BinaryIO, *, chunk_size: int = _DEFAULT_CHUNK_
         if not chunk:
             break
         digest.update(chunk)
+        size += len(chunk)
 
     if can_seek:
         stream.seek(0)
 
-    return digest.hexdigest()
+    return digest.hexdigest(), size
 
 
 def compute_file_sha256(path: Path, *, chunk_size: int = _DEFAULT_CHUNK_SIZE) -> str:
-    """Compute the SHA-256 checksum of a file on disk."""
+    """Compute the SHA-256 checksum of a file on disk, ``chunk_size`` bytes at a time."""
 
-    digest = hashlib.sha256()
     with path.open("rb") as handle:
+        # Hash straight from the page cache without copying into Python
+        # bytes; empty files and filesystems without mmap support use the
+        # streaming path.
+        try:
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                digest = hashlib.sha256()
+                with memoryview(mapped) as view:
+                    for offset in range(0, len(view), chunk_size):
+                        digest.update(view[offset : offset + chunk_size])
+                return digest.hexdigest()
+        except (OSError, ValueError):
+            pass
+
+        digest = hashlib.sha256()
         while True:
             chunk = handle.read(chunk_size)
             if not chunk:
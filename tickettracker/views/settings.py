@@ -1,9 +1,12 @@
 """Application settings management views."""
 from __future__ import annotations
 
+import hashlib
+import json
+import re
 from dataclasses import replace
-from copy import deepcopy
-from typing import Dict, List, Mapping, Tuple
+from functools import lru_cache
+from typing import Dict, Iterable, List, Mapping, Tuple
 
 from flask import (
     Blueprint,
@@ -12,6 +15,7 @@ from flask import (
     redirect,
     render_template,
     request,
+    session,
     url_for,
 )
 
@@ -36,29 +40,38 @@ from ..summary import CLIPBOARD_SUMMARY_SECTION_DESCRIPTIONS
 settings_bp = Blueprint("settings", __name__)
 
 
-_DEFAULT_STAGE_LABELS = [
+_COMPACT_OFF_VALUES = frozenset({"0", "false", "no", "off"})
+_NON_NEGATIVE_INT_PATTERN = re.compile(r"\d+")
+# Commas plus every boundary ``str.splitlines`` recognises, so one split pass
+# replaces the former replace-then-splitlines copy.
+_MULTILINE_SEPARATOR_PATTERN = re.compile(r"[,\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]+")
+
+_TEMPLATES_DIGEST_KEY = "tickettracker.templates_digest"
+
+_FORM_DEFAULTS_CACHE_SIZE = 4
+_FORM_DEFAULTS_CACHE: Dict[int, Tuple[AppConfig, Dict[str, object]]] = {}
+
+_DEFAULT_STAGE_LABELS = (
     "Comfort Zone",
     "Attention Zone",
     "Action Zone",
     "Fire Zone",
-]
+)
 
 
-def _stage_labels(stage_count: int) -> List[str]:
+@lru_cache(maxsize=16)
+def _stage_labels(stage_count: int) -> Tuple[str, ...]:
     """Return human-friendly labels for SLA stages."""
 
     if stage_count <= 0:
-        return []
+        return ()
 
-    labels: List[str] = []
-    for index in range(stage_count):
-        if index < len(_DEFAULT_STAGE_LABELS):
-            labels.append(_DEFAULT_STAGE_LABELS[index])
-        else:
-            labels.append(f"Stage {index + 1}")
-    return labels
+    return _DEFAULT_STAGE_LABELS[:stage_count] + tuple(
+        f"Stage {index + 1}" for index in range(len(_DEFAULT_STAGE_LABELS), stage_count)
+    )
 
 
+@lru_cache(maxsize=64)
 def _stage_index_from_key(key: str) -> int | None:
     """Return the numeric index for gradient stage keys (e.g. ``stage2``)."""
 
@@ -75,6 +88,14 @@ def _app_config() -> AppConfig:
 
 
 def _persist_config(updated_config: AppConfig) -> bool:
+    # Saving an unchanged form would rewrite identical JSON; the path check
+    # keeps the error below for configs that were never loaded from disk.
+    if (
+        updated_config.source_path is not None
+        and updated_config == current_app.config.get("APP_CONFIG")
+    ):
+        return True
+
     try:
         save_config(updated_config)
     except ValueError:
@@ -86,73 +107,174 @@ def _persist_config(updated_config: AppConfig) -> bool:
 
     current_app.config["APP_CONFIG"] = updated_config
     current_app.config["DEMO_MODE"] = updated_config.demo_mode
+    _FORM_DEFAULTS_CACHE.clear()
     return True
 
 
+def _templates_digest() -> str:
+    # Deploys can change the templates without touching the config. Sources
+    # are hashed once per app, since auto-reload disables the ETag below.
+    digest = current_app.extensions.get(_TEMPLATES_DIGEST_KEY)
+    if digest is None:
+        jinja_env = current_app.jinja_env
+        hasher = hashlib.sha256()
+        for name in sorted(jinja_env.list_templates()):
+            source, _filename, _uptodate = jinja_env.loader.get_source(jinja_env, name)
+            hasher.update(name.encode("utf-8"))
+            hasher.update(source.encode("utf-8"))
+        digest = current_app.extensions[_TEMPLATES_DIGEST_KEY] = hasher.hexdigest()
+    return digest
+
+
+def _settings_page_etag(
+    config: AppConfig, demo_status: Mapping[str, object], compact_mode: bool
+) -> str | None:
+    """Return an ETag for the rendered settings page, or ``None`` if it may not be reused."""
+
+    # Rendering consumes pending flash messages, and auto-reloaded templates
+    # can change without any config change, so neither may be answered by 304.
+    if session.get("_flashes") or current_app.jinja_env.auto_reload:
+        return None
+
+    # Derived from content only, so every worker issues the same tag for the
+    # same page. The secret key is never rendered and stays out of the hash.
+    persisted = config.to_json_dict()
+    persisted.pop("secret_key", None)
+    fingerprint = json.dumps(
+        {
+            "config": persisted,
+            "demo_status": demo_status,
+            "compact": compact_mode,
+            "query": request.query_string.decode("latin-1"),
+            "templates": _templates_digest(),
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()
+
+
 def _is_compact_mode() -> bool:
     value = request.args.get("compact")
     if value is None:
         return True
 
-    normalized = value.strip().lower()
-    if normalized in {"0", "false", "no", "off"}:
+    # Toggle links always send "0" or "1", so try the raw value before
+    # normalizing hand-typed variants; anything unrecognised means compact.
+    if value in _COMPACT_OFF_VALUES:
         return False
-    if normalized in {"1", "true", "yes", "on"}:
-        return True
-    return True
+    return value.strip().lower() not in _COMPACT_OFF_VALUES
 
 
 def _compact_query_value(compact_mode: bool) -> str:
     return "1" if compact_mode else "0"
 
 
-def _clipboard_section_options(config: AppConfig) -> List[Tuple[str, str]]:
+def _clipboard_section_options(config: AppConfig) -> Tuple[Tuple[str, str], ...]:
     """Return ordered clipboard sections paired with their descriptions."""
 
-    options: List[Tuple[str, str]] = list(
-        CLIPBOARD_SUMMARY_SECTION_DESCRIPTIONS.items()
-    )
-    seen = {section for section, _ in options}
-    custom_description = "Custom clipboard section configured in your settings."
+    return _section_options_for(tuple(config.clipboard_summary.available_sections()))
 
-    for section in config.clipboard_summary.available_sections():
-        if section in seen:
-            continue
-        options.append((section, custom_description))
-        seen.add(section)
 
-    return options
+@lru_cache(maxsize=16)
+def _section_options_for(sections: Tuple[str, ...]) -> Tuple[Tuple[str, str], ...]:
+    # Keyed on the configured section names rather than the config object,
+    # so saving new settings simply produces a different cache key.
+    options = dict(CLIPBOARD_SUMMARY_SECTION_DESCRIPTIONS)
+    custom_description = "Custom clipboard section configured in your settings."
+    for section in sections:
+        options.setdefault(section, custom_description)
+    return tuple(options.items())
 
 
 def _build_compact_toggle_url(endpoint: str, compact_mode: bool, **values: object) -> str:
-    query_args: Dict[str, List[str]] = {key: list(items) for key, items in request.args.lists()}
-    query_args["compact"] = [_compact_query_value(not compact_mode)]
+    toggled_value = _compact_query_value(not compact_mode)
+    if not request.args:
+        return url_for(endpoint, **values, compact=toggled_value)
 
+    # ``lists()`` already yields fresh lists, so flatten in a single pass;
+    # assigning ``compact`` afterwards keeps its position when present.
     flattened: Dict[str, object] = {
-        key: value if len(value) != 1 else value[0]
-        for key, value in query_args.items()
+        key: items[0] if len(items) == 1 else items
+        for key, items in request.args.lists()
     }
+    flattened["compact"] = toggled_value
     return url_for(endpoint, **values, **flattened)
 
 
+def _parse_stage_days(raw_values: Iterable[str]) -> List[int] | None:
+    """Return the non-blank thresholds as integers, or ``None`` if any is invalid."""
+
+    days: List[int] = []
+    for value in raw_values:
+        if not value:
+            continue
+        number = _parse_non_negative_int(value)
+        if number is None:
+            return None
+        days.append(number)
+    return days
+
+
+def _padded_stage_values(values: Iterable[object], stage_count: int) -> List[str]:
+    """Return ``values`` as strings, padded with blanks to ``stage_count`` inputs."""
+
+    padded = [str(value) for value in values]
+    # A non-positive shortfall multiplies to an empty list, so no length check.
+    padded.extend([""] * (stage_count - len(padded)))
+    return padded
+
+
+def _parse_non_negative_int(value: str) -> int | None:
+    """Return ``value`` as an integer, or ``None`` if it is not a plain non-negative integer."""
+
+    # Validate with the regex so bad input skips int()'s exception path.
+    if not _NON_NEGATIVE_INT_PATTERN.fullmatch(value):
+        return None
+    return int(value)
+
+
 def _parse_multiline_field(raw_value: str | None) -> List[str]:
     if not raw_value:
         return []
 
-    entries: List[str] = []
-    seen: set[str] = set()
-    for segment in raw_value.replace(",", "\n").splitlines():
-        text = segment.strip()
-        if not text or text in seen:
-            continue
-        entries.append(text)
-        seen.add(text)
-    return entries
+    segments = _MULTILINE_SEPARATOR_PATTERN.split(raw_value)
+    if len(segments) == 1:
+        # A single entry cannot repeat, so skip the dedupe pass.
+        text = raw_value.strip()
+        return [text] if text else []
+    return list(dict.fromkeys(text for text in map(str.strip, segments) if text))
 
 
 def _color_palette_defaults(config: AppConfig) -> Dict[str, Dict[str, str] | str]:
-    """Return default color values for palette sections, including fallbacks."""
+    """Return default color values for palette sections, including fallbacks.
+
+    The result is cached and shared between requests; treat it as read-only.
+    """
 
+    return _palette_defaults_for_keys(*_palette_default_keys(config))
+
+
+def _palette_default_keys(config: AppConfig) -> Tuple[Tuple[str, ...], ...]:
+    return (
+        tuple(str(key) for key in config.colors.gradient.keys()),
+        tuple(str(key) for key in config.colors.statuses.keys()),
+        tuple(str(priority) for priority in config.priorities),
+        tuple(str(key) for key in config.colors.priorities.keys()),
+        tuple(str(key) for key in config.colors.tags.keys()),
+    )
+
+
+@lru_cache(maxsize=16)
+def _palette_defaults_for_keys(
+    gradient_keys: Tuple[str, ...],
+    status_keys: Tuple[str, ...],
+    priorities: Tuple[str, ...],
+    priority_keys: Tuple[str, ...],
+    tag_keys: Tuple[str, ...],
+) -> Dict[str, Dict[str, str] | str]:
+    # Defaults depend only on which keys are configured, never on the
+    # configured colours themselves, so the key sets make a complete key.
     primary_fallback = (
         normalize_hex_color(DEFAULT_GRADIENT_COLORS[GRADIENT_STAGE_ORDER[0]])
         or DEFAULT_GRADIENT_COLORS[GRADIENT_STAGE_ORDER[0]]
@@ -162,16 +284,14 @@ def _color_palette_defaults(config: AppConfig) -> Dict[str, Dict[str, str] | str
     for key in [*GRADIENT_STAGE_ORDER, GRADIENT_OVERDUE_KEY]:
         default_value = normalize_hex_color(DEFAULT_GRADIENT_COLORS.get(key))
         gradient_defaults[str(key)] = default_value or primary_fallback
-    for key in config.colors.gradient.keys():
-        key_str = str(key)
+    for key_str in gradient_keys:
         if key_str not in gradient_defaults:
             gradient_defaults[key_str] = primary_fallback
 
     status_defaults: Dict[str, str] = {}
     for key, value in DEFAULT_STATUS_COLORS.items():
         status_defaults[str(key)] = normalize_hex_color(value) or primary_fallback
-    for key in config.colors.statuses.keys():
-        key_str = str(key)
+    for key_str in status_keys:
         if key_str not in status_defaults:
             status_defaults[key_str] = primary_fallback
 
@@ -179,13 +299,11 @@ def _color_palette_defaults(config: AppConfig) -> Dict[str, Dict[str, str] | str
     base_priority_defaults = {
         str(priority): color for priority, color in DEFAULT_PRIORITY_COLORS.items()
     }
-    for priority in config.priorities:
-        key_str = str(priority)
+    for key_str in priorities:
         default_value = base_priority_defaults.get(key_str)
         normalized = normalize_hex_color(default_value)
         priority_defaults[key_str] = normalized or primary_fallback
-    for key in config.colors.priorities.keys():
-        key_str = str(key)
+    for key_str in priority_keys:
         if key_str not in priority_defaults:
             default_value = base_priority_defaults.get(key_str)
             normalized = normalize_hex_color(default_value)
@@ -194,8 +312,7 @@ def _color_palette_defaults(config: AppConfig) -> Dict[str, Dict[str, str] | str
     tag_defaults: Dict[str, str] = {}
     for key, value in DEFAULT_TAG_COLORS.items():
         tag_defaults[str(key)] = normalize_hex_color(value) or primary_fallback
-    for key in config.colors.tags.keys():
-        key_str = str(key)
+    for key_str in tag_keys:
         if key_str not in tag_defaults:
             tag_defaults[key_str] = primary_fallback
 
@@ -216,8 +333,59 @@ def _color_palette_defaults(config: AppConfig) -> Dict[str, Dict[str, str] | str
 def _color_palette_display(config: AppConfig) -> Dict[str, Dict[str, Dict[str, str]]]:
     """Return palette data structure used to populate the settings form."""
 
-    defaults = _color_palette_defaults(config)
+    return _build_color_palette_display(
+        _color_palette_defaults(config),
+        config.colors.ticket_title,
+        _color_overrides(config),
+    )
+
+
+def _shared_color_palette_display(
+    config: AppConfig,
+) -> Dict[str, Dict[str, Dict[str, str]]]:
+    """Return the settings palette for display only.
+
+    The result is cached and shared between requests; treat it as read-only.
+    Use :func:`_color_palette_display` when entries will be updated in place.
+    """
 
+    return _palette_display_for(
+        _palette_default_keys(config),
+        str(config.colors.ticket_title),
+        tuple(
+            (category, tuple((str(key), str(value)) for key, value in source.items()))
+            for category, source in _color_overrides(config)
+        ),
+    )
+
+
+@lru_cache(maxsize=16)
+def _palette_display_for(
+    default_keys: Tuple[Tuple[str, ...], ...],
+    ticket_title: str,
+    overrides: Tuple[Tuple[str, Tuple[Tuple[str, str], ...]], ...],
+) -> Dict[str, Dict[str, Dict[str, str]]]:
+    return _build_color_palette_display(
+        _palette_defaults_for_keys(*default_keys),
+        ticket_title,
+        [(category, dict(items)) for category, items in overrides],
+    )
+
+
+def _color_overrides(config: AppConfig) -> List[Tuple[str, Dict[str, str]]]:
+    return [
+        ("gradient", config.colors.gradient),
+        ("statuses", config.colors.statuses),
+        ("priorities", config.colors.priorities),
+        ("tags", config.colors.tags),
+    ]
+
+
+def _build_color_palette_display(
+    defaults: Dict[str, Dict[str, str] | str],
+    ticket_title: object,
+    overrides: Iterable[Tuple[str, Mapping[str, object]]],
+) -> Dict[str, Dict[str, Dict[str, str]]]:
     palette: Dict[str, Dict[str, Dict[str, str]]] = {
         "ticket_title": {
             "value": defaults["ticket_title"],
@@ -232,17 +400,12 @@ def _color_palette_display(config: AppConfig) -> Dict[str, Dict[str, Dict[str, s
             for key, value in defaults.get(category, {}).items()
         }
 
-    ticket_value = normalize_hex_color(config.colors.ticket_title)
+    ticket_value = normalize_hex_color(ticket_title)
     if ticket_value:
         palette["ticket_title"]["value"] = ticket_value
         palette["ticket_title"]["text"] = ticket_value
 
-    for category_name, source in [
-        ("gradient", config.colors.gradient),
-        ("statuses", config.colors.statuses),
-        ("priorities", config.colors.priorities),
-        ("tags", config.colors.tags),
-    ]:
+    for category_name, source in overrides:
         for key, value in source.items():
             key_str = str(key)
             normalized = normalize_hex_color(value)
@@ -269,10 +432,33 @@ def _color_palette_display(config: AppConfig) -> Dict[str, Dict[str, Dict[str, s
     return palette
 
 
+def _palette_category_colors(
+    palette: Dict[str, Dict[str, Dict[str, str]]], category: str
+) -> Dict[str, str]:
+    """Return the submitted colors for ``category``, falling back to defaults."""
+
+    return {
+        str(key): normalized
+        for key, entry in palette.get(category, {}).items()
+        if (
+            normalized := normalize_hex_color(entry.get("value"))
+            or normalize_hex_color(entry.get("default"))
+        )
+    }
+
+
 def _color_category_entries(
-    config: AppConfig, palette: Dict[str, Dict[str, Dict[str, str]]]
+    config: AppConfig,
+    palette: Dict[str, Dict[str, Dict[str, str]]],
+    *,
+    display: bool = False,
 ) -> List[Tuple[str, str, List[Dict[str, object]]]]:
-    """Return ordered palette entries grouped by section for rendering and parsing."""
+    """Return ordered palette entries grouped by section for rendering and parsing.
+
+    Entries reference the palette dicts so submitted values can be applied in
+    place; with ``display`` they instead carry the resolved ``value`` and
+    ``default`` used by the settings form.
+    """
 
     sections: List[Tuple[str, str, List[Dict[str, object]]]] = []
 
@@ -283,33 +469,30 @@ def _color_category_entries(
                 "ticket_title",
                 "Ticket title",
                 [
-                    {
-                        "key": "ticket_title",
-                        "label": "Ticket title",
-                        "entry": ticket_entry,
-                        "field_name": "colors[ticket_title]",
-                    }
+                    _color_entry_info(
+                        "ticket_title",
+                        "Ticket title",
+                        ticket_entry,
+                        "colors[ticket_title]",
+                        display,
+                    )
                 ],
             )
         )
 
     gradient_entries: List[Dict[str, object]] = []
     gradient_palette = palette.get("gradient", {})
-    gradient_order = [*GRADIENT_STAGE_ORDER, GRADIENT_OVERDUE_KEY]
-    for key in gradient_palette.keys():
-        key_str = str(key)
-        if key_str not in gradient_order:
-            gradient_order.append(key_str)
-    stage_indexes = [
-        index
-        for index in (
-            _stage_index_from_key(str(key))
-            for key in gradient_order
+    gradient_order = list(
+        dict.fromkeys(
+            [*GRADIENT_STAGE_ORDER, GRADIENT_OVERDUE_KEY, *map(str, gradient_palette.keys())]
         )
-        if index is not None
-    ]
-    if stage_indexes:
-        stage_count = max(stage_indexes) + 1
+    )
+    # Labels are built once for the highest stage present, so every stage
+    # key below indexes straight into the list.
+    stage_indexes = {key: _stage_index_from_key(key) for key in gradient_order}
+    known_indexes = [index for index in stage_indexes.values() if index is not None]
+    if known_indexes:
+        stage_count = max(known_indexes) + 1
     else:
         stage_count = len(GRADIENT_STAGE_ORDER)
     stage_labels = _stage_labels(stage_count)
@@ -320,43 +503,29 @@ def _color_category_entries(
         if key == GRADIENT_OVERDUE_KEY:
             label = "Overdue"
         else:
-            stage_index = _stage_index_from_key(str(key))
+            stage_index = stage_indexes[key]
             if stage_index is None:
                 label = str(key).replace("_", " ").title()
             else:
-                if stage_index >= len(stage_labels):
-                    stage_labels = _stage_labels(stage_index + 1)
                 label = stage_labels[stage_index]
         gradient_entries.append(
-            {
-                "key": str(key),
-                "label": label,
-                "entry": entry,
-                "field_name": f"colors[gradient][{key}]",
-            }
+            _color_entry_info(str(key), label, entry, f"colors[gradient][{key}]", display)
         )
     if gradient_entries:
         sections.append(("gradient", "Gradient stages", gradient_entries))
 
     status_entries: List[Dict[str, object]] = []
     status_palette = palette.get("statuses", {})
-    status_order = list(DEFAULT_STATUS_COLORS.keys())
-    for key in status_palette.keys():
-        key_str = str(key)
-        if key_str not in status_order:
-            status_order.append(key_str)
+    status_order = list(
+        dict.fromkeys([*DEFAULT_STATUS_COLORS.keys(), *map(str, status_palette.keys())])
+    )
     for key in status_order:
         entry = status_palette.get(str(key))
         if not entry:
             continue
         label = str(key).replace("_", " ").title()
         status_entries.append(
-            {
-                "key": str(key),
-                "label": label,
-                "entry": entry,
-                "field_name": f"colors[statuses][{key}]",
-            }
+            _color_entry_info(str(key), label, entry, f"colors[statuses][{key}]", display)
         )
     if status_entries:
         sections.append(("statuses", "Status overrides", status_entries))
@@ -371,35 +540,21 @@ def _color_category_entries(
         if not entry:
             continue
         priority_entries.append(
-            {
-                "key": str(key),
-                "label": str(key),
-                "entry": entry,
-                "field_name": f"colors[priorities][{key}]",
-            }
+            _color_entry_info(str(key), str(key), entry, f"colors[priorities][{key}]", display)
         )
     if priority_entries:
         sections.append(("priorities", "Priority colors", priority_entries))
 
     tag_entries: List[Dict[str, object]] = []
     tag_palette = palette.get("tags", {})
-    tag_order = list(DEFAULT_TAG_COLORS.keys())
-    for key in tag_palette.keys():
-        key_str = str(key)
-        if key_str not in tag_order:
-            tag_order.append(key_str)
+    tag_order = list(dict.fromkeys([*DEFAULT_TAG_COLORS.keys(), *map(str, tag_palette.keys())]))
     for key in tag_order:
         entry = tag_palette.get(str(key))
         if not entry:
             continue
         label = str(key).replace("_", " ").title()
         tag_entries.append(
-            {
-                "key": str(key),
-                "label": label,
-                "entry": entry,
-                "field_name": f"colors[tags][{key}]",
-            }
+            _color_entry_info(str(key), label, entry, f"colors[tags][{key}]", display)
         )
     if tag_entries:
         sections.append(("tags", "Tag colors", tag_entries))
@@ -436,42 +591,54 @@ def _process_color_entry(
     entry["value"] = normalized
 
 
+def _color_entry_info(
+    key: str, label: str, entry: object, field_name: str, display: bool
+) -> Dict[str, object]:
+    if display:
+        entry_dict = entry if isinstance(entry, dict) else {}
+        return {
+            "key": key,
+            "label": label,
+            "value": entry_dict.get("value", entry_dict.get("default")),
+            "default": entry_dict.get("default", entry_dict.get("value")),
+            "field_name": field_name,
+        }
+    return {"key": key, "label": label, "entry": entry, "field_name": field_name}
+
+
 def _color_sections(
     config: AppConfig, palette: Dict[str, Dict[str, Dict[str, str]]]
 ) -> List[Dict[str, object]]:
     """Return palette metadata for rendering the settings form."""
 
-    sections: List[Dict[str, object]] = []
-    for name, label, entries in _color_category_entries(config, palette):
-        section_entries: List[Dict[str, object]] = []
-        for entry_info in entries:
-            entry = entry_info["entry"]
-            if not isinstance(entry, dict):
-                continue
-            section_entries.append(
-                {
-                    "key": entry_info["key"],
-                    "label": entry_info["label"],
-                    "value": entry.get("value", entry.get("default")),
-                    "default": entry.get("default", entry.get("value")),
-                    "field_name": entry_info["field_name"],
-                }
-            )
-        if section_entries:
-            sections.append({"name": name, "label": label, "entries": section_entries})
-    return sections
+    return [
+        {"name": name, "label": label, "entries": entries}
+        for name, label, entries in _color_category_entries(config, palette, display=True)
+    ]
+
 
 def _form_defaults(config: AppConfig) -> Dict[str, object]:
-    color_palette = _color_palette_display(config)
+    """Return settings form values for ``config``.
+
+    Settings changes always install a new ``AppConfig`` (see
+    :func:`_persist_config`), so results are cached per config object and
+    shared between requests; treat them as read-only.
+    """
+
+    cached = _FORM_DEFAULTS_CACHE.get(id(config))
+    # The entry keeps its config alive, so a matching id cannot be a reused one.
+    if cached is not None and cached[0] is config:
+        return cached[1]
+
+    form_defaults = _build_form_defaults(config)
+    if len(_FORM_DEFAULTS_CACHE) >= _FORM_DEFAULTS_CACHE_SIZE:
+        _FORM_DEFAULTS_CACHE.clear()
+    _FORM_DEFAULTS_CACHE[id(config)] = (config, form_defaults)
+    return form_defaults
 
-    html_sections = (
-        list(config.clipboard_summary.html_sections)
-        or config.clipboard_summary.sections_for_html()
-    )
-    text_sections = (
-        list(config.clipboard_summary.text_sections)
-        or config.clipboard_summary.sections_for_text()
-    )
+
+def _build_form_defaults(config: AppConfig) -> Dict[str, object]:
+    color_palette = _shared_color_palette_display(config)
 
     default_sla = DEFAULT_CONFIG.get("sla", {})
     base_due_stage_days = list(default_sla.get("due_stage_days", []))
@@ -492,21 +659,17 @@ def _form_defaults(config: AppConfig) -> Dict[str, object]:
         else:
             priority_stage_days[priority] = list(DEFAULT_PRIORITY_STAGE_DAYS_FALLBACK)
 
-    stage_lengths = [len(due_stage_days)]
-    stage_lengths.extend(len(values) for values in priority_stage_days.values())
-    stage_lengths.append(len(base_due_stage_days))
-    stage_count = max(stage_lengths) if stage_lengths else len(base_due_stage_days) or 1
-
-    padded_due_stage_days = [str(value) for value in due_stage_days]
-    if len(padded_due_stage_days) < stage_count:
-        padded_due_stage_days.extend([""] * (stage_count - len(padded_due_stage_days)))
+    stage_count = max(
+        len(due_stage_days),
+        len(base_due_stage_days),
+        *(len(values) for values in priority_stage_days.values()),
+    )
 
-    display_priority_stage_days: Dict[str, List[str]] = {}
-    for priority, values in priority_stage_days.items():
-        display_values = [str(value) for value in values]
-        if len(display_values) < stage_count:
-            display_values.extend([""] * (stage_count - len(display_values)))
-        display_priority_stage_days[priority] = display_values
+    padded_due_stage_days = _padded_stage_values(due_stage_days, stage_count)
+    display_priority_stage_days = {
+        priority: _padded_stage_values(values, stage_count)
+        for priority, values in priority_stage_days.items()
+    }
 
     default_due_days = config.sla.default_due_days
     default_due_display = "" if default_due_days is None else str(default_due_days)
@@ -516,8 +679,9 @@ def _form_defaults(config: AppConfig) -> Dict[str, object]:
         "priorities": "\n".join(config.priorities),
         "hold_reasons": "\n".join(config.hold_reasons),
         "workflow": "\n".join(config.workflow),
-        "selected_html_sections": set(html_sections),
-        "selected_text_sections": set(text_sections),
+        # The ``sections_for_*`` helpers already fall back when a list is empty.
+        "selected_html_sections": set(config.clipboard_summary.sections_for_html()),
+        "selected_text_sections": set(config.clipboard_summary.sections_for_text()),
         "updates_limit": str(config.clipboard_summary.updates_limit),
         "clipboard_debug_status": config.clipboard_summary.debug_status,
         "auto_return_to_list": config.auto_return_to_list,
@@ -537,41 +701,44 @@ def view_settings():
     compact_mode = _is_compact_mode()
     section_options = _clipboard_section_options(config)
 
+    # The POST branch below only reads from the defaults (it builds its own
+    # palette to edit), so neither they nor the shared palette inside them
+    # need a defensive copy.
     defaults = _form_defaults(config)
-    form_data = deepcopy(defaults)
+    form_data = defaults
 
     if request.method == "POST":
-        default_submitted_by = request.form.get("default_submitted_by", "").strip()
-        priorities_input = request.form.get("priorities", "")
-        hold_reasons_input = request.form.get("hold_reasons", "")
-        workflow_input = request.form.get("workflow", "")
-        html_section_values = set(request.form.getlist("html_sections"))
-        text_section_values = set(request.form.getlist("text_sections"))
-        updates_limit_input = request.form.get("updates_limit", "").strip()
-        default_due_days_input = request.form.get("default_due_days", "").strip()
-        due_stage_day_inputs = [value.strip() for value in request.form.getlist("due_stage_days")]
-
-        debug_status_enabled = request.form.get("clipboard_debug_status") is not None
-        auto_return_enabled = request.form.get("auto_return_to_list") is not None
-        demo_mode_enabled = request.form.get("demo_mode") is not None
+        form = request.form
+        default_submitted_by = form.get("default_submitted_by", "").strip()
+        priorities_input = form.get("priorities", "")
+        hold_reasons_input = form.get("hold_reasons", "")
+        workflow_input = form.get("workflow", "")
+        html_section_values = set(form.getlist("html_sections"))
+        text_section_values = set(form.getlist("text_sections"))
+        updates_limit_input = form.get("updates_limit", "").strip()
+        default_due_days_input = form.get("default_due_days", "").strip()
+        due_stage_day_inputs = [value.strip() for value in form.getlist("due_stage_days")]
+
+        debug_status_enabled = form.get("clipboard_debug_status") is not None
+        auto_return_enabled = form.get("auto_return_to_list") is not None
+        demo_mode_enabled = form.get("demo_mode") is not None
 
         color_palette = _color_palette_display(config)
         color_entries = _color_category_entries(config, color_palette)
         invalid_color_labels: List[str] = []
         for _, _, entries in color_entries:
             for entry_info in entries:
-                _process_color_entry(request.form, entry_info, invalid_color_labels)
+                _process_color_entry(form, entry_info, invalid_color_labels)
 
         section_names = [name for name, _ in section_options]
 
         priority_stage_inputs: Dict[str, List[str]] = {}
         prefix = "priority_stage_days["
-        for key in request.form.keys():
-            if key.startswith(prefix) and key.endswith("]"):
-                priority_name = key[len(prefix) : -1]
-                priority_stage_inputs[priority_name] = [
-                    value.strip() for value in request.form.getlist(key)
-                ]
+        for key, value in form.items(multi=True):
+            if not key.startswith(prefix) or not key.endswith("]"):
+                continue
+            priority_name = key[len(prefix) : -1]
+            priority_stage_inputs.setdefault(priority_name, []).append(value.strip())
 
         if not due_stage_day_inputs:
             due_stage_day_inputs = list(defaults.get("due_stage_days", []))
@@ -583,46 +750,10 @@ def view_settings():
         for priority, values in priority_stage_inputs.items():
             display_priority_values[priority] = list(values)
 
-        raw_due_stage_values = list(due_stage_day_inputs)
-        raw_priority_stage_values = {
-            priority: list(values) for priority, values in display_priority_values.items()
-        }
-
-        stage_lengths = [len(raw_due_stage_values)]
-        stage_lengths.extend(len(values) for values in raw_priority_stage_values.values())
-        stage_lengths.append(int(defaults.get("sla_stage_count", 0)))
-        stage_count = max(stage_lengths) if stage_lengths else int(defaults.get("sla_stage_count", 0))
-        if stage_count <= 0:
-            stage_count = max(1, len(raw_due_stage_values))
-
-        due_stage_display = list(raw_due_stage_values)
-        if len(due_stage_display) < stage_count:
-            due_stage_display.extend([""] * (stage_count - len(due_stage_display)))
-
-        padded_priority_display: Dict[str, List[str]] = {}
-        for priority, values in raw_priority_stage_values.items():
-            padded = list(values)
-            if len(padded) < stage_count:
-                padded.extend([""] * (stage_count - len(padded)))
-            padded_priority_display[priority] = padded
-
-        form_data = {
-            "default_submitted_by": default_submitted_by,
-            "priorities": priorities_input,
-            "hold_reasons": hold_reasons_input,
-            "workflow": workflow_input,
-            "selected_html_sections": html_section_values,
-            "selected_text_sections": text_section_values,
-            "updates_limit": updates_limit_input,
-            "clipboard_debug_status": debug_status_enabled,
-            "auto_return_to_list": auto_return_enabled,
-            "demo_mode": demo_mode_enabled,
-            "default_due_days": default_due_days_input,
-            "due_stage_days": due_stage_display,
-            "priority_stage_days": padded_priority_display,
-            "sla_stage_count": stage_count,
-            "color_palette": color_palette,
-        }
+        # Both dicts above hold fresh lists, so they can be parsed without
+        # another copy; the padded display versions are built separately.
+        raw_due_stage_values = due_stage_day_inputs
+        raw_priority_stage_values = display_priority_values
 
         errors: List[str] = []
 
@@ -638,95 +769,62 @@ def view_settings():
         if not workflow:
             errors.append("Provide at least one workflow status.")
 
-        html_sections = [
-            section for section in section_names if section in html_section_values
-        ]
+        html_sections = list(filter(html_section_values.__contains__, section_names))
         if not html_sections:
             html_sections = config.clipboard_summary.sections_for_html()
 
-        text_sections = [
-            section for section in section_names if section in text_section_values
-        ]
-        if not text_sections:
+        if text_section_values == html_section_values:
+            # Identical selections (the default form state) would filter to
+            # the same list, and an empty text list falls back to HTML anyway.
             text_sections = html_sections or config.clipboard_summary.sections_for_text()
+        else:
+            text_sections = list(filter(text_section_values.__contains__, section_names))
+            if not text_sections:
+                text_sections = html_sections or config.clipboard_summary.sections_for_text()
 
         if not default_submitted_by:
             errors.append("Default submitter cannot be empty.")
 
         if updates_limit_input:
-            try:
-                updates_limit = int(updates_limit_input)
-            except ValueError:
+            updates_limit = _parse_non_negative_int(updates_limit_input)
+            if updates_limit is None:
                 errors.append("Updates limit must be a non-negative integer.")
-            else:
-                if updates_limit < 0:
-                    errors.append("Updates limit must be a non-negative integer.")
         else:
             updates_limit = config.clipboard_summary.updates_limit
 
         due_stage_days: List[int] = []
         if raw_due_stage_values:
-            for value in raw_due_stage_values:
-                if not value:
-                    continue
-                try:
-                    number = int(value)
-                except ValueError:
-                    errors.append("Due stage thresholds must be non-negative integers.")
-                    due_stage_days = []
-                    break
-                if number < 0:
-                    errors.append("Due stage thresholds must be non-negative integers.")
-                    due_stage_days = []
-                    break
-                due_stage_days.append(number)
+            parsed_due_days = _parse_stage_days(raw_due_stage_values)
+            if parsed_due_days is None:
+                errors.append("Due stage thresholds must be non-negative integers.")
+            else:
+                due_stage_days = parsed_due_days
 
         priority_stage_days: Dict[str, List[int]] = {}
         if raw_priority_stage_values:
-            priority_order: List[str] = list(defaults.get("priority_stage_days", {}).keys())
-            for priority in raw_priority_stage_values.keys():
-                if priority not in priority_order:
-                    priority_order.append(priority)
+            priority_order = list(
+                dict.fromkeys(
+                    [*defaults.get("priority_stage_days", {}).keys(), *raw_priority_stage_values]
+                )
+            )
 
             priority_error_reported = False
             for priority in priority_order:
-                raw_values = raw_priority_stage_values.get(priority, [])
-                cleaned: List[int] = []
-                for value in raw_values:
-                    if not value:
-                        continue
-                    try:
-                        number = int(value)
-                    except ValueError:
-                        if not priority_error_reported:
-                            errors.append(
-                                "Priority stage thresholds must be non-negative integers."
-                            )
-                            priority_error_reported = True
-                        cleaned = []
-                        break
-                    if number < 0:
-                        if not priority_error_reported:
-                            errors.append(
-                                "Priority stage thresholds must be non-negative integers."
-                            )
-                            priority_error_reported = True
-                        cleaned = []
-                        break
-                    cleaned.append(number)
-                if cleaned:
+                cleaned = _parse_stage_days(raw_priority_stage_values.get(priority, []))
+                if cleaned is None:
+                    if not priority_error_reported:
+                        errors.append(
+                            "Priority stage thresholds must be non-negative integers."
+                        )
+                        priority_error_reported = True
+                elif cleaned:
                     priority_stage_days[priority] = cleaned
 
         if default_due_days_input:
-            try:
-                default_due_days_value = int(default_due_days_input)
-            except ValueError:
+            default_due_days_value = _parse_non_negative_int(default_due_days_input)
+            if default_due_days_value is None:
                 errors.append("Default backlog due days must be a non-negative integer.")
                 default_due_days_value = config.sla.default_due_days
-            else:
-                if default_due_days_value < 0:
-                    errors.append("Default backlog due days must be a non-negative integer.")
-                    default_due_days_value = config.sla.default_due_days
         else:
             default_due_days_value = None
 
@@ -745,37 +843,10 @@ def view_settings():
             for message in errors:
                 flash(message, "error")
         else:
-            gradient_colors: Dict[str, str] = {}
-            for key, entry in color_palette.get("gradient", {}).items():
-                normalized = normalize_hex_color(entry.get("value")) or normalize_hex_color(
-                    entry.get("default")
-                )
-                if normalized:
-                    gradient_colors[str(key)] = normalized
-
-            status_colors: Dict[str, str] = {}
-            for key, entry in color_palette.get("statuses", {}).items():
-                normalized = normalize_hex_color(entry.get("value")) or normalize_hex_color(
-                    entry.get("default")
-                )
-                if normalized:
-                    status_colors[str(key)] = normalized
-
-            priority_colors: Dict[str, str] = {}
-            for key, entry in color_palette.get("priorities", {}).items():
-                normalized = normalize_hex_color(entry.get("value")) or normalize_hex_color(
-                    entry.get("default")
-                )
-                if normalized:
-                    priority_colors[str(key)] = normalized
-
-            tag_colors: Dict[str, str] = {}
-            for key, entry in color_palette.get("tags", {}).items():
-                normalized = normalize_hex_color(entry.get("value")) or normalize_hex_color(
-                    entry.get("default")
-                )
-                if normalized:
-                    tag_colors[str(key)] = normalized
+            gradient_colors = _palette_category_colors(color_palette, "gradient")
+            status_colors = _palette_category_colors(color_palette, "statuses")
+            priority_colors = _palette_category_colors(color_palette, "priorities")
+            tag_colors = _palette_category_colors(color_palette, "tags")
 
             ticket_title_value = normalize_hex_color(
                 color_palette.get("ticket_title", {}).get("value")
@@ -866,7 +937,57 @@ def view_settings():
                             "Unable to restore demo mode after save failure: %s", exc
                         )
 
+        # Only reached when the form is shown again, so the padded display
+        # values are not built for saves that redirect.
+        max_priority_len = max(
+            (len(values) for values in raw_priority_stage_values.values()), default=0
+        )
+        stage_count = max(
+            len(raw_due_stage_values),
+            max_priority_len,
+            int(defaults.get("sla_stage_count", 0)),
+        )
+        if stage_count <= 0:
+            stage_count = 1
+
+        due_stage_display = _padded_stage_values(raw_due_stage_values, stage_count)
+        padded_priority_display = {
+            priority: _padded_stage_values(values, stage_count)
+            for priority, values in raw_priority_stage_values.items()
+        }
+
+        form_data = {
+            "default_submitted_by": default_submitted_by,
+            "priorities": priorities_input,
+            "hold_reasons": hold_reasons_input,
+            "workflow": workflow_input,
+            "selected_html_sections": html_section_values,
+            "selected_text_sections": text_section_values,
+            "updates_limit": updates_limit_input,
+            "clipboard_debug_status": debug_status_enabled,
+            "auto_return_to_list": auto_return_enabled,
+            "demo_mode": demo_mode_enabled,
+            "default_due_days": default_due_days_input,
+            "due_stage_days": due_stage_display,
+            "priority_stage_days": padded_priority_display,
+            "sla_stage_count": stage_count,
+            "color_palette": color_palette,
+        }
+
     demo_status = demo_manager.status()
+
+    response = current_app.response_class()
+    etag = None
+    if request.method == "GET":
+        etag = _settings_page_etag(config, demo_status, compact_mode)
+    if etag is not None:
+        response.set_etag(etag)
+        response.cache_control.no_cache = True
+        # Answer a matching If-None-Match before building the page.
+        response.make_conditional(request)
+        if response.status_code == 304:
+            return response
+
     color_sections = _color_sections(config, form_data.get("color_palette", {}))
 
     stage_count_value = form_data.get("sla_stage_count", 0)
@@ -876,19 +997,22 @@ def view_settings():
         stage_count = 0
     stage_labels = _stage_labels(stage_count)
 
-    return render_template(
-        "settings.html",
-        config=config,
-        form=form_data,
-        demo_status=demo_status,
-        compact_mode=compact_mode,
-        compact_toggle_url=_build_compact_toggle_url(
-            "settings.view_settings", compact_mode
-        ),
-        clipboard_sections=section_options,
-        color_sections=color_sections,
-        sla_stage_labels=stage_labels,
+    response.set_data(
+        render_template(
+            "settings.html",
+            config=config,
+            form=form_data,
+            demo_status=demo_status,
+            compact_mode=compact_mode,
+            compact_toggle_url=_build_compact_toggle_url(
+                "settings.view_settings", compact_mode
+            ),
+            clipboard_sections=section_options,
+            color_sections=color_sections,
+            sla_stage_labels=stage_labels,
+        )
     )
+    return response
 
 
 @settings_bp.post("/settings/demo-mode")
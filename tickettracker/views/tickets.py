@@ -20,6 +20,7 @@ from flask import (
     url_for,
 )
 from sqlalchemy import case, or_
+from sqlalchemy.orm import selectinload
 from werkzeug.datastructures import FileStorage
 from werkzeug.utils import secure_filename
 
@@ -27,11 +28,21 @@ from ..config import AppConfig
 from ..extensions import db
 from ..models import Attachment, Tag, Ticket, TicketUpdate
 from ..summary import build_ticket_clipboard_summary
-from ..utils.uploads import compute_stream_sha256, generate_uuid7
+from ..utils.uploads import compute_stream_sha256_and_size, generate_uuid7
 
 
 tickets_bp = Blueprint("tickets", __name__)
 
+_COMPACT_OFF_VALUES = frozenset({"0", "false", "no", "off"})
+
+# Collections read by ticket cards, tooltips, and clipboard summaries. Loading
+# them up front keeps list rendering at a fixed number of queries.
+_TICKET_CARD_LOADS = (
+    selectinload(Ticket.tags),
+    selectinload(Ticket.updates),
+    selectinload(Ticket.attachments),
+)
+
 
 @tickets_bp.app_context_processor
 def inject_ticket_helpers() -> Dict[str, object]:
@@ -605,12 +616,11 @@ def _is_compact_mode() -> bool:
     if value is None:
         return True
 
-    normalized = value.strip().lower()
-    if normalized in {"0", "false", "no", "off"}:
+    # Toggle links always send "0" or "1", so try the raw value before
+    # normalizing hand-typed variants; anything unrecognised means compact.
+    if value in _COMPACT_OFF_VALUES:
         return False
-    if normalized in {"1", "true", "yes", "on"}:
-        return True
-    return True
+    return value.strip().lower() not in _COMPACT_OFF_VALUES
 
 
 def _compact_query_value(compact_mode: bool) -> str:
@@ -620,14 +630,17 @@ def _compact_query_value(compact_mode: bool) -> str:
 def _build_compact_toggle_url(endpoint: str, compact_mode: bool, **values: object) -> str:
     """Return a URL that toggles the compact flag while preserving filters."""
 
-    query_args: Dict[str, List[str]] = {key: list(items) for key, items in request.args.lists()}
     toggled_value = _compact_query_value(not compact_mode)
-    query_args["compact"] = [toggled_value]
+    if not request.args:
+        return url_for(endpoint, **values, compact=toggled_value)
 
+    # ``lists()`` already yields fresh lists, so flatten in a single pass;
+    # assigning ``compact`` afterwards keeps its position when present.
     flattened: Dict[str, object] = {
-        key: value if len(value) != 1 else value[0]
-        for key, value in query_args.items()
+        key: items[0] if len(items) == 1 else items
+        for key, items in request.args.lists()
     }
+    flattened["compact"] = toggled_value
     return url_for(endpoint, **values, **flattened)
 
 
@@ -650,7 +663,8 @@ def _store_attachments(
         original_name = upload.filename
         safe_name = secure_filename(original_name) or "attachment"
 
-        checksum = compute_stream_sha256(upload.stream)
+        # The size is measured while hashing, so saved files need no stat.
+        checksum, file_size = compute_stream_sha256_and_size(upload.stream)
 
         existing = (
             Attachment.query.filter_by(checksum=checksum)
@@ -662,7 +676,6 @@ def _store_attachments(
 
         stored_filename: str
         file_uuid: str
-        file_size: int | None = None
 
         if existing:
             file_uuid = existing.file_uuid or generate_uuid7()
@@ -673,20 +686,9 @@ def _store_attachments(
             stored_filename = existing.stored_filename
             target_path = upload_root / stored_filename
 
-            if target_path.exists():
-                file_size = existing.size
-                if file_size is None:
-                    try:
-                        file_size = target_path.stat().st_size
-                    except OSError:
-                        file_size = None
-            else:
+            if not target_path.exists():
                 target_path.parent.mkdir(parents=True, exist_ok=True)
                 upload.save(target_path)
-                try:
-                    file_size = target_path.stat().st_size
-                except OSError:
-                    file_size = existing.size
         else:
             file_uuid = generate_uuid7()
             timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S%f")
@@ -696,10 +698,6 @@ def _store_attachments(
             target_path = upload_root / stored_filename
             target_path.parent.mkdir(parents=True, exist_ok=True)
             upload.save(target_path)
-            try:
-                file_size = target_path.stat().st_size
-            except OSError:
-                file_size = None
 
         attachment = Attachment(
             ticket=ticket,
@@ -720,7 +718,7 @@ def _store_attachments(
 @tickets_bp.route("/")
 def list_tickets():
     config = _app_config()
-    query = Ticket.query
+    query = Ticket.query.options(*_TICKET_CARD_LOADS)
 
     compact_mode = _is_compact_mode()
     title_color = config.colors.ticket_title_color()
@@ -859,7 +857,11 @@ def list_tickets():
 @tickets_bp.route("/tickets/<int:ticket_id>")
 def ticket_detail(ticket_id: int):
     config = _app_config()
-    ticket = Ticket.query.get_or_404(ticket_id)
+    ticket = Ticket.query.options(
+        selectinload(Ticket.tags),
+        selectinload(Ticket.updates).selectinload(TicketUpdate.attachments),
+        selectinload(Ticket.attachments),
+    ).get_or_404(ticket_id)
     compact_mode = _is_compact_mode()
     title_color = config.colors.ticket_title_color()
     status_palette = _build_status_palette(config)